@@ -11,14 +11,13 @@ from sudoku_solver_tim.puzzle import Puzzle
 import time
 import numpy as np
 from sudoku_solver_tim.strategies.master.brute_force import brute_force
+from sudoku_solver_tim.stream import iter_solve, read_puzzles
 import json
 
 
 def read_grids():
-    with open("tests/fixtures/grids.txt", "r") as f:
-        grids = f.readlines()
-
-    return [grid.strip() for grid in grids]
+    # Read lazily, so this also works for files that don't fit in memory
+    return read_puzzles("tests/fixtures/grids.txt")
 
 
 
@@ -40,12 +39,12 @@ def calculate_stats(timings):
 
 
 
-def benchmark_puzzles(grids, strategies=None):
+def benchmark_puzzles(grids, strategies=None, search=None):
     timings = []
     for grid in grids:
         puzzle = Puzzle.from_string(grid)
         start_time = time.time()
-        puzzle.solve()
+        puzzle.solve(strategies=strategies, search=search)
         end_time = time.time()
         
         timings.append(end_time - start_time)
@@ -63,16 +62,43 @@ def save_results(results, output_file):
     
 
 
+def benchmark_stream(path, workers=1):
+    start_time = time.time()
+    n = sum(1 for _ in iter_solve(path, workers=workers))
+    total_time = time.time() - start_time
+    print(f"Streamed {n} puzzles with {workers} workers in {total_time} seconds")
+    return total_time
+
+
+def benchmark_array(path, engine="puzzle"):
+    from sudoku_solver_tim.arrays import solve_array
+
+    puzzles = np.array([[int(c) if c != "." else 0 for c in grid] for grid in read_puzzles(path)], dtype=np.uint8)
+    start_time = time.time()
+    solve_array(puzzles, engine=engine)
+    total_time = time.time() - start_time
+    print(f"Solved {len(puzzles)} puzzles with solve_array(engine={engine!r}) in {total_time} seconds")
+    return total_time
+
+
 def main():
-    grids = read_grids()
-    stats = benchmark_puzzles(grids)
+    stats = benchmark_puzzles(read_grids())
     print("Completed full benchmark")
+
+    benchmark_stream("tests/fixtures/grids.txt")
+    for engine in ["puzzle", "numpy"]:
+        benchmark_array("tests/fixtures/grids.txt", engine=engine)
     # save_results(stats, "benchmark_results_2k.json")
 
-    # stats_brute = benchmark_puzzles(grids, strategies=[brute_force])
+    # stats_brute = benchmark_puzzles(read_grids(), strategies=[brute_force])
     # print("Completed brute force benchmark")
     # save_results(stats_brute, "benchmark_results_2k_brute.json")
 
+    # Compare the search backends of brute force
+    for search in ["backtrack", "dlx"]:
+        stats, _ = benchmark_puzzles(read_grids(), strategies=[brute_force], search=search)
+        print(f"Completed brute force benchmark with search={search}: median {stats['median']:.6f} seconds")
+
 
 if __name__ == "__main__":
     main()
@@ -9,4 +9,19 @@ logging.basicConfig(
 
 from sudoku_solver_tim.puzzle import Puzzle
 
-__all__ = ["Puzzle"]
\ No newline at end of file
+# Imported on first use, so that importing the package (f.e. to start the command line) doesn't load sqlite3
+_LAZY = {
+    "SolveCache": "sudoku_solver_tim.cache",
+    "SolveResult": "sudoku_solver_tim.batch",
+    "solve_many": "sudoku_solver_tim.batch",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["Puzzle", "SolveCache", "SolveResult", "solve_many"]
@@ -0,0 +1,232 @@
+"""
+Solve puzzles stored in NumPy arrays (or any other buffer), without converting them to nested lists.
+
+The input has one puzzle of 81 values per row, 0 for an empty cell.
+Every row of the output holds the 81 values after solving (0 for unsolved cells),
+followed by a status code:
+
+- 0: not solved with the given strategies
+- 1-4: solved, with the difficulty level of the hardest strategy used (see `strategies.LEVELS`)
+- 255: not a valid puzzle
+
+NumPy is an optional dependency: `pip install sudoku-solver-tim[numpy]`.
+
+Example:
+
+```python
+import numpy as np
+from sudoku_solver_tim.arrays import solve_array
+
+puzzles = np.zeros((1000, 81), dtype=np.uint8)  # filled by an upstream service
+out = np.empty((1000, 82), dtype=np.uint8)
+solve_array(puzzles, out)
+solutions, codes = out[:, :81], out[:, 81]
+```
+
+With `engine="numpy"`, the naked and hidden singles (the easy strategies) are first applied
+to all puzzles at once with array operations, see `propagate_singles()`.
+Only the puzzles that need more than singles go through the `Puzzle` strategies.
+This is much faster for batches of mostly easy puzzles.
+"""
+
+from typing import Callable, List, Literal
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("solve_array needs numpy, install it with `pip install sudoku-solver-tim[numpy]`") from e
+
+from sudoku_solver_tim.batch import solve_many
+from sudoku_solver_tim.bitmask import ALL_DIGITS, BIT_TO_DIGIT, POPCOUNT
+from sudoku_solver_tim.strategies import (
+    LEVELS,
+    STRATEGY_LEVELS,
+    STRATEGY_NAMES,
+    single_candidates,
+    single_position,
+)
+from sudoku_solver_tim.topology import CELL_UNITS, UNITS
+
+STATUS_UNSOLVED = 0
+STATUS_INVALID = 255
+
+# Status code of a puzzle solved with a strategy, by the name in Puzzle.strategies_used
+NAME_CODES = {name: LEVELS.index(STRATEGY_LEVELS[strategy]) + 1 for name, strategy in STRATEGY_NAMES.items()}
+
+# Byte value of "0", to convert between digits and the characters of a puzzle string
+ZERO = ord("0")
+
+# Result of propagate_singles() per puzzle
+SOLVED = 1
+STALLED = 0
+CONTRADICTION = -1
+
+# Puzzles propagated at a time by solve_array(), to keep the arrays small
+KERNEL_BATCH = 16384
+
+# The tables of sudoku_solver_tim.bitmask and topology as arrays, to index with arrays of masks and cells
+POPCOUNT_ARRAY = np.array(POPCOUNT, dtype=np.uint8)
+DIGIT_ARRAY = np.array([BIT_TO_DIGIT.get(mask, 0) for mask in range(ALL_DIGITS + 1)], dtype=np.uint8)
+UNITS_ARRAY = np.array(UNITS, dtype=np.intp)
+CELL_UNITS_ARRAY = np.array(CELL_UNITS, dtype=np.intp)
+DIGIT_BITS = np.array([1 << d for d in range(9)], dtype=np.uint16)
+# The candidate mask of a cell by its value: all digits for an empty cell
+VALUE_MASKS = np.array([ALL_DIGITS, *DIGIT_BITS], dtype=np.uint16)
+
+
+def candidates(values) -> "np.ndarray":
+    """
+    The candidate tensor of puzzles: an (N, 81, 9) bool array, where `[n, i, d - 1]` is set
+    when cell i of puzzle n can hold digit d. A given only has its own digit as a candidate.
+
+    Args:
+        values: An (N, 81) array with values 0-9, 0 for an empty cell.
+    """
+    values = np.asarray(values).reshape(-1, 81, 1)
+    return np.where(values > 0, values == np.arange(1, 10), True)
+
+
+def _units_once_twice(masks: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    For every unit of every puzzle: the digits in at least one cell, and the digits in more than one.
+    Like in brute_force.propagate(), but for all puzzles at once.
+    """
+    cells = masks[:, UNITS_ARRAY]
+    once = cells[:, :, 0].copy()
+    twice = np.zeros_like(once)
+    for k in range(1, 9):
+        mask = cells[:, :, k]
+        twice |= once & mask
+        once |= mask
+    return once, twice
+
+
+def _cell_union(unit_masks: "np.ndarray") -> "np.ndarray":
+    """Combine per-unit masks into per-cell masks: the union over the 3 units of every cell."""
+    units = unit_masks[:, CELL_UNITS_ARRAY]
+    return units[:, :, 0] | units[:, :, 1] | units[:, :, 2]
+
+
+def _propagate_masks(masks: "np.ndarray") -> "np.ndarray":
+    """
+    Apply naked and hidden singles to an (N, 81) array of 9-bit candidate masks in place,
+    until no puzzle changes. See `propagate_singles()`.
+    """
+    status = np.full(len(masks), STALLED, dtype=np.int8)
+    # Puzzles that are still changing
+    active = np.arange(len(masks))
+
+    while active.size:
+        current = masks[active]
+
+        # Naked singles: remove the value of every cell with one candidate from its peers
+        single = POPCOUNT_ARRAY[current] == 1
+        once, twice = _units_once_twice(np.where(single, current, 0).astype(np.uint16))
+        duplicate = (twice != 0).any(1)
+        updated = np.where(single, current, current & ~_cell_union(once))
+
+        # Hidden singles: a digit with one position in a unit is placed there
+        once, twice = _units_once_twice(updated)
+        missing = (once != ALL_DIGITS).any(1)
+        hidden = updated & _cell_union(once & ~twice)
+        ambiguous = (POPCOUNT_ARRAY[hidden] > 1).any(1)
+        updated = np.where(hidden != 0, hidden, updated)
+
+        counts = POPCOUNT_ARRAY[updated]
+        contradiction = duplicate | missing | ambiguous | (counts == 0).any(1)
+        changed = (updated != current).any(1)
+        masks[active] = updated
+
+        done = contradiction | ~changed
+        status[active[done]] = np.where(
+            contradiction[done], CONTRADICTION, np.where((counts[done] == 1).all(1), SOLVED, STALLED)
+        )
+        active = active[~done]
+
+    return status
+
+
+def propagate_singles(candidates: "np.ndarray") -> "np.ndarray":
+    """
+    Apply the single candidates and single position strategies to a batch of puzzles at once.
+
+    The candidates are packed into 9-bit masks (like `Cell.mask`) for the propagation,
+    so every step is a handful of array operations on all puzzles that are still changing.
+
+    Args:
+        candidates: An (N, 81, 9) bool candidate tensor, see `candidates()`. Updated in place.
+
+    Returns:
+        np.ndarray: Per puzzle SOLVED (1), STALLED (0) when the singles made no more progress,
+            or CONTRADICTION (-1) when the puzzle has no solution.
+    """
+    masks = (candidates.reshape(-1, 81, 9) * DIGIT_BITS).sum(2, dtype=np.uint16)
+    status = _propagate_masks(masks)
+    candidates[...] = (masks[:, :, None] & DIGIT_BITS) != 0
+    return status
+
+
+def solve_array(
+    inp,
+    out: "np.ndarray | None" = None,
+    workers: int = 1,
+    strategies: List[Callable] | None = None,
+    engine: Literal["puzzle", "numpy"] = "puzzle",
+) -> "np.ndarray":
+    """
+    Solve every row of `inp`, and write the solutions and status codes to `out`. See the module docstring.
+
+    Args:
+        inp: An array of shape (N, 81), or any buffer of N * 81 bytes, with values 0-9.
+            It is read without a copy when it already holds uint8 values.
+        out: An uint8 array of shape (N, 82) to write the results to. A new array if None.
+        workers: The number of worker processes, see `sudoku_solver_tim.batch.solve_many()`.
+        strategies: The strategies to use, see `Puzzle.solve()`.
+        engine: "puzzle" to solve every row with `Puzzle.solve()`, or "numpy" to first solve all
+            rows that only need singles at once (see `propagate_singles()`).
+            The results are the same.
+
+    Returns:
+        np.ndarray: `out`
+    """
+    # numpy reads bytes as a single string instead of as a buffer
+    puzzles = np.frombuffer(inp, dtype=np.uint8) if isinstance(inp, (bytes, bytearray)) else np.asarray(inp)
+    if puzzles.dtype != np.uint8:
+        puzzles = puzzles.astype(np.uint8)
+    puzzles = puzzles.reshape(-1, 81)
+    if puzzles.size and puzzles.max() > 9:
+        raise ValueError("Puzzle values have to be 0-9")
+
+    if out is None:
+        out = np.empty((len(puzzles), 82), dtype=np.uint8)
+    elif out.shape != (len(puzzles), 82) or out.dtype != np.uint8:
+        raise ValueError(f"out has to be an uint8 array of shape {(len(puzzles), 82)}")
+
+    if engine not in ("puzzle", "numpy"):
+        raise ValueError(f"Invalid engine: {engine}")
+
+    pending = np.arange(len(puzzles))
+    if engine == "numpy" and (strategies is None or {single_candidates, single_position} <= set(strategies)):
+        unsolved = []
+        for start in range(0, len(puzzles), KERNEL_BATCH):
+            batch = puzzles[start:start + KERNEL_BATCH]
+            masks = VALUE_MASKS[batch]
+            solved = _propagate_masks(masks) == SOLVED
+            rows = out[start:start + len(batch)]
+            rows[solved, :81] = DIGIT_ARRAY[masks[solved]]
+            rows[solved, 81] = NAME_CODES["Single Candidate"]
+            unsolved.append(start + np.flatnonzero(~solved))
+        pending = np.concatenate(unsolved) if unsolved else pending
+
+    # The 81 characters of a row: the digits, with 0 for an empty cell
+    grids = ((puzzles[i] + ZERO).tobytes().decode("ascii") for i in pending)
+    for result in solve_many(grids, workers=workers, strategies=strategies):
+        row = out[pending[result.index]]
+        row[:81] = np.frombuffer(result.solution.replace(".", "0").encode("ascii"), dtype=np.uint8) - ZERO
+        if result.error is not None:
+            row[81] = STATUS_INVALID
+        elif result.solved:
+            row[81] = max((NAME_CODES[name] for name in result.strategies_used), default=1)
+        else:
+            row[81] = STATUS_UNSOLVED
+    return out
@@ -0,0 +1,153 @@
+"""
+Solve many puzzles in a pool of worker processes.
+
+Puzzles are sent to the workers as 81 bytes each (see `Puzzle.from_string()`),
+in chunks, and only the solutions and strategy names are sent back.
+Identical puzzles in a batch are solved once.
+
+Example:
+
+```python
+from sudoku_solver_tim import solve_many
+
+for result in solve_many(grids, workers=8):
+    print(result.index, result.solution, result.strategies_used)
+```
+"""
+
+from typing import Callable, Iterable, Iterator, List, NamedTuple
+import os
+
+from sudoku_solver_tim.puzzle import Puzzle
+
+# Chunks per worker when no chunksize is given, to balance out slow chunks
+CHUNKS_PER_WORKER = 4
+
+
+class SolveResult(NamedTuple):
+    """
+    The result of solving one puzzle of a batch.
+
+    `solution` is the puzzle after solving in the same 81 character format,
+    with . for the cells that could not be solved.
+    `error` is the message of an invalid puzzle, in which case `solution` is the puzzle itself.
+    """
+
+    index: int
+    puzzle: str
+    solution: str
+    solved: bool
+    strategies_used: frozenset[str]
+    error: str | None = None
+
+
+def to_payload(grid: str | List[List[int]]) -> bytes:
+    """
+    The 81 byte form of a puzzle string (with . or 0 for an empty cell) or grid.
+
+    Malformed puzzles are encoded as they are (non-ASCII characters as ?),
+    so that they get an error result of their own instead of failing the whole batch.
+    """
+    if not isinstance(grid, str):
+        grid = "".join(str(value) for row in grid for value in row)
+    return grid.strip().replace("0", ".").encode("ascii", errors="replace")
+
+
+def _solve_chunk(payloads: List[bytes], strategies: List[Callable] | None) -> List[tuple]:
+    results = []
+    for payload in payloads:
+        if len(payload) != 81:
+            results.append((payload, False, (), f"A puzzle needs 81 cells, got {len(payload)}"))
+            continue
+        try:
+            puzzle = Puzzle.from_string(payload.decode("ascii"))
+            solved = puzzle.solve(strategies)
+        except Exception as e:
+            results.append((payload, False, (), str(e) or type(e).__name__))
+            continue
+        solution = puzzle.to_string().encode("ascii")
+        results.append((solution, solved, tuple(sorted(puzzle.strategies_used)), None))
+    return results
+
+
+def solve_many(
+    grids: Iterable[str | List[List[int]]],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    ordered: bool = True,
+    strategies: List[Callable] | None = None,
+) -> Iterator[SolveResult]:
+    """
+    Solve a batch of puzzles in `workers` processes, see the module docstring.
+
+    Args:
+        grids: Puzzle strings (see `Puzzle.from_string()`) or grids (see `Puzzle`).
+            An invalid puzzle gets a result with an `error`, the others are still solved.
+        workers: The number of worker processes, defaults to the number of CPUs.
+            With 1, the puzzles are solved in this process.
+        chunksize: The number of puzzles sent to a worker at a time.
+            Defaults to spreading the batch over 4 chunks per worker.
+        ordered: Yield the results in the order of `grids`. Otherwise they are yielded as soon as they are ready.
+        strategies: The strategies to use, see `Puzzle.solve()`.
+
+    Yields:
+        SolveResult: One result per puzzle in `grids`, including duplicates.
+    """
+    payloads = [to_payload(grid) for grid in grids]
+
+    # Solve every distinct puzzle once
+    unique = {}
+    for payload in payloads:
+        unique.setdefault(payload, len(unique))
+    indices = [[] for _ in unique]
+    for index, payload in enumerate(payloads):
+        indices[unique[payload]].append(index)
+    unique = list(unique)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, -(-len(unique) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [unique[i:i + chunksize] for i in range(0, len(unique), chunksize)]
+
+    starts = range(0, len(unique), chunksize)
+
+    def results(start: int, chunk_results: List[tuple]) -> Iterator[SolveResult]:
+        for u, (solution, solved, strategies_used, error) in enumerate(chunk_results, start):
+            puzzle = unique[u].decode("ascii")
+            solution = solution.decode("ascii")
+            strategies_used = frozenset(strategies_used)
+            for index in indices[u]:
+                yield SolveResult(index, puzzle, solution, solved, strategies_used, error)
+
+    def in_order(done: Iterable[List[tuple]]) -> Iterator[SolveResult]:
+        # Duplicates of a puzzle can come before the results in between, so those wait in `pending`
+        pending = {}
+        next_index = 0
+        for start, chunk_results in zip(starts, done):
+            for result in results(start, chunk_results):
+                pending[result.index] = result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+
+    if workers <= 1:
+        done = (_solve_chunk(chunk, strategies) for chunk in chunks)
+        if ordered:
+            yield from in_order(done)
+        else:
+            for start, chunk_results in zip(starts, done):
+                yield from results(start, chunk_results)
+        return
+
+    # Imported here, as it takes longer than the rest of the package
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            # map() returns the chunks in order
+            yield from in_order(executor.map(_solve_chunk, chunks, [strategies] * len(chunks)))
+        else:
+            futures = {executor.submit(_solve_chunk, chunk, strategies): start for start, chunk in zip(starts, chunks)}
+            for future in as_completed(futures):
+                yield from results(futures[future], future.result())
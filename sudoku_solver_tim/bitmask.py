@@ -0,0 +1,82 @@
+"""
+Bitmask helpers for candidate sets.
+
+The candidates (markup) of a cell are stored as a 9-bit integer,
+where bit `d - 1` is set when digit `d` is still possible.
+
+Example:
+
+```python
+from sudoku_solver_tim.bitmask import BIT, DIGITS, POPCOUNT
+
+mask = BIT[1] | BIT[3]  # 0b101
+DIGITS[mask]  # (1, 3)
+POPCOUNT[mask]  # 2
+```
+"""
+
+from typing import Iterable
+
+from sudoku_solver_tim.topology import BLOCKS, COLUMNS, ROWS
+
+# Mask with all 9 digits set
+ALL_DIGITS = 0x1FF
+
+# BIT[d] is the mask for digit d. BIT[0] is 0 so that an empty cell value maps to an empty mask.
+BIT = (0,) + tuple(1 << (d - 1) for d in range(1, 10))
+
+# Number of digits in a mask
+POPCOUNT = tuple(bin(mask).count("1") for mask in range(ALL_DIGITS + 1))
+
+# Sorted tuple of digits in a mask
+DIGITS = tuple(
+    tuple(d for d in range(1, 10) if mask & BIT[d]) for mask in range(ALL_DIGITS + 1)
+)
+
+# Digit of a mask with a single bit set
+BIT_TO_DIGIT = {BIT[d]: d for d in range(1, 10)}
+
+
+def to_mask(digits: Iterable[int] | int) -> int:
+    """
+    Convert a digit or an iterable of digits to a candidate mask.
+
+    Args:
+        digits: A single digit (1-9) or an iterable of digits.
+
+    Returns:
+        int: The candidate mask.
+    """
+    if isinstance(digits, int):
+        return BIT[digits]
+    mask = 0
+    for d in digits:
+        mask |= BIT[d]
+    return mask
+
+
+# 81-bit masks of the cells in each unit, where bit `row * 9 + col` is a cell.
+# Puzzle.bitboards[d] & ROW_MASKS[r] gives the cells in row r that can hold digit d.
+ROW_MASKS = tuple(sum(1 << i for i in cells) for cells in ROWS)
+COLUMN_MASKS = tuple(sum(1 << i for i in cells) for cells in COLUMNS)
+BLOCK_MASKS = tuple(sum(1 << i for i in cells) for cells in BLOCKS)
+UNIT_MASKS = ROW_MASKS + COLUMN_MASKS + BLOCK_MASKS
+ALL_CELLS = (1 << 81) - 1
+
+
+def bit_indices(board: int) -> list[int]:
+    """
+    Return the indices of the bits set in a (cell) bitboard, lowest first.
+
+    Args:
+        board: An integer bitboard, f.e. `Puzzle.bitboards[d] & ROW_MASKS[r]`.
+
+    Returns:
+        list[int]: The positions of the set bits.
+    """
+    indices = []
+    while board:
+        low = board & -board
+        indices.append(low.bit_length() - 1)
+        board ^= low
+    return indices
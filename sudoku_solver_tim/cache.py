@@ -0,0 +1,210 @@
+"""
+Cache of solve results, to make solving the same puzzle again a lookup.
+
+Results are keyed by the puzzle string (see `Puzzle.to_string()`), the strategies used
+and the search backend of the brute force strategy (which picks one of several solutions), and hold the values after solving, `Puzzle.strategies_used` and `Puzzle.steps`.
+They are kept in an in-memory LRU of `maxsize` entries, and optionally in a SQLite file
+that is shared between processes and runs.
+
+The SQLite file uses write-ahead logging, so that readers don't block the writer,
+and waits up to `timeout` seconds for a lock held by another process.
+Every process opens its own connection on first use (also after a fork).
+
+Example:
+
+```python
+from sudoku_solver_tim import Puzzle, SolveCache
+
+cache = SolveCache("solves.sqlite", maxsize=10_000)
+puzzle = Puzzle.from_string(string)
+puzzle.solve(cache=cache)
+cache.cache_info()
+#> CacheInfo(hits=0, misses=1, evictions=0, maxsize=10000, currsize=1)
+```
+"""
+
+from typing import TYPE_CHECKING, Callable, List, NamedTuple
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.puzzle import Puzzle
+
+from collections import OrderedDict
+import json
+import os
+import sqlite3
+import threading
+
+from sudoku_solver_tim.strategies import STRATEGIES
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class CachedSolve(NamedTuple):
+    """
+    A cached solve: the puzzle string after solving, `Puzzle.strategies_used` and the steps of the solve.
+    """
+
+    solution: str
+    strategies_used: frozenset[str]
+    steps: tuple[str, ...]
+
+
+def cache_key(string: str, strategies: List[Callable] | None = None, search: str = "backtrack") -> str:
+    """
+    The key of a puzzle string solved with `strategies` (all strategies if None) and `search`.
+    """
+    if strategies is None:
+        strategies = STRATEGIES
+    names = ",".join(s.__name__ for s in STRATEGIES if s in strategies)
+    return f"{string}:{names}:{search}"
+
+
+class SolveCache:
+    """
+    In-memory LRU of solve results, optionally backed by a SQLite file. See the module docstring.
+
+    Args:
+        path: The SQLite file. If None, results are only kept in memory.
+        maxsize: The number of results kept in memory.
+        timeout: Seconds to wait for a lock on the SQLite file held by another process.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, maxsize: int = 1024, timeout: float = 30.0) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def __enter__(self) -> "SolveCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection can't be shared with a forked process, so every process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS solves ("
+                "key TEXT PRIMARY KEY, solution TEXT NOT NULL, strategies_used TEXT NOT NULL, steps TEXT NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Close the connection to the SQLite file, if this process opened one.
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def _remember(self, key: str, result: CachedSolve) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(
+        self, string: str, strategies: List[Callable] | None = None, search: str = "backtrack"
+    ) -> CachedSolve | None:
+        """
+        Look up the result for a puzzle string, first in memory and then in the SQLite file.
+        Counts a hit or a miss.
+        """
+        key = cache_key(string, strategies, search)
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+            elif self.path is not None:
+                row = self._connect().execute(
+                    "SELECT solution, strategies_used, steps FROM solves WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    solution, strategies_used, steps = row
+                    result = CachedSolve(solution, frozenset(json.loads(strategies_used)), tuple(json.loads(steps)))
+                    self._remember(key, result)
+
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def put(
+        self, string: str, strategies: List[Callable] | None, result: CachedSolve, search: str = "backtrack"
+    ) -> None:
+        """
+        Store the result for a puzzle string in memory and in the SQLite file.
+        """
+        key = cache_key(string, strategies, search)
+        with self._lock:
+            self._remember(key, result)
+            if self.path is not None:
+                connection = self._connect()
+                # Another process may have stored the same (deterministic) result in the meantime
+                connection.execute(
+                    "INSERT OR IGNORE INTO solves VALUES (?, ?, ?, ?)",
+                    (key, result.solution, json.dumps(sorted(result.strategies_used)), json.dumps(result.steps)),
+                )
+                connection.commit()
+
+    def solve(self, puzzle: "Puzzle", strategies: List[Callable] | None = None, search: str | None = None) -> bool:
+        """
+        Solve `puzzle` like `Puzzle.solve()`, or fill it in from the cache.
+
+        A result from the cache sets the values of the solved cells,
+        but not the candidates the strategies removed from the unsolved cells.
+
+        Returns:
+            True if the puzzle is solved, False otherwise.
+        """
+        string = puzzle.to_string()
+        search = puzzle._search(search)
+        result = self.get(string, strategies, search)
+        if result is None:
+            start = len(puzzle.steps)
+            solved = puzzle.solve(strategies, search)
+            result = CachedSolve(puzzle.to_string(), frozenset(puzzle.strategies_used), tuple(puzzle.steps[start:]))
+            self.put(string, strategies, result, search)
+            return solved
+
+        for cell, char in zip(puzzle.cells, result.solution):
+            if char != "." and not cell.is_solved:
+                cell.set_solution(int(char))
+        puzzle.strategies_used.update(result.strategies_used)
+        puzzle.steps.extend(result.steps)
+        return puzzle.is_solved()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        The hit, miss and eviction counts of this cache in this process, like `functools.lru_cache`.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._memory))
+
+    def clear(self) -> None:
+        """
+        Empty the in-memory LRU and reset the counts. The SQLite file is kept.
+        """
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = self.evictions = 0
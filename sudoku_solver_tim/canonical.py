@@ -0,0 +1,235 @@
+"""
+Canonical form of a sudoku under its symmetry group.
+
+These changes to a grid turn a puzzle into an equivalent one, with the same solving steps:
+
+- relabelling the digits (9! ways)
+- permuting the bands of 3 rows, and the rows within each band (6^4 ways)
+- permuting the stacks of 3 columns, and the columns within each stack (6^4 ways)
+- transposing the grid (2 ways)
+
+Together about 1.2 trillion transforms. The canonical form is the smallest grid
+over all of them, read row by row, where the digits are relabelled in order of appearance
+and an empty cell counts as larger than any digit (so the givens come first).
+Equivalent puzzles have the same canonical form.
+
+Instead of trying every transform, the grid is built one row at a time.
+Every partial transform (a choice of orientation, the first rows and the column order)
+that produces the smallest rows so far is kept, and all others are dropped.
+Partial transforms that leave the same remaining grid are equivalent, and only one of them is kept.
+
+Example:
+
+```python
+from sudoku_solver_tim.canonical import canonical_form
+
+string, transform = canonical_form(values)  # values: 81 digits, 0 for an empty cell
+transform.revert(transform.apply(grid)) == grid
+```
+"""
+
+from functools import cache
+from itertools import permutations, product
+from typing import List, NamedTuple
+
+# Sort key of an empty cell, larger than any label (1-9)
+EMPTY = 10
+
+# The 6^4 column orders that keep the stacks together: (stack order) x (column order within each stack)
+COLUMN_ORDERS = tuple(
+    tuple(stack * 3 + column for stack, columns in zip(stacks, inner) for column in columns)
+    for stacks in permutations(range(3))
+    for inner in product(permutations(range(3)), repeat=3)
+)
+
+# Cell index in the transposed grid
+TRANSPOSED = tuple(i % 9 * 9 + i // 9 for i in range(81))
+
+
+class Transform(NamedTuple):
+    """
+    A transform of the symmetry group: transposing, then reordering rows and columns, then relabelling.
+
+    Row `r` of the result is row `rows[r]` of the (transposed) grid, and likewise for columns.
+    Digit `d` becomes `digits[d]`, with `digits[0] == 0` for empty cells.
+    """
+
+    transpose: bool
+    rows: tuple[int, ...]
+    columns: tuple[int, ...]
+    digits: tuple[int, ...]
+
+    def apply(self, grid: List[List[int]]) -> List[List[int]]:
+        """
+        Return the transformed grid, for example the canonical form of a puzzle.
+        """
+        if self.transpose:
+            grid = [list(column) for column in zip(*grid)]
+        digits = self.digits
+        return [[digits[grid[row][column]] for column in self.columns] for row in self.rows]
+
+    def revert(self, grid: List[List[int]]) -> List[List[int]]:
+        """
+        Undo the transform, for example to map the solution of a canonical form back to the original puzzle.
+        """
+        inverse = [0] * 10
+        for digit, label in enumerate(self.digits):
+            inverse[label] = digit
+        result = [[0] * 9 for _ in range(9)]
+        for r, row in enumerate(self.rows):
+            for c, column in enumerate(self.columns):
+                result[row][column] = inverse[grid[r][c]]
+        if self.transpose:
+            result = [list(column) for column in zip(*result)]
+        return result
+
+
+@cache
+def _first_row_orders(givens: int) -> tuple[tuple[int, ...], tuple[tuple[int, ...], ...]]:
+    """
+    The smallest first row for a row with givens in the columns of the 9-bit mask `givens`,
+    and the column orders that produce it.
+
+    The digits of a row are all different, so their labels are 1, 2, 3... in order,
+    and only the positions of the givens matter.
+    """
+    best, orders = None, []
+    for order in COLUMN_ORDERS:
+        keys = []
+        label = 0
+        for column in order:
+            if givens >> column & 1:
+                label += 1
+                keys.append(label)
+            else:
+                keys.append(EMPTY)
+        keys = tuple(keys)
+        if best is None or keys < best:
+            best, orders = keys, [order]
+        elif keys == best:
+            orders.append(order)
+    return best, tuple(orders)
+
+
+def _remaining(values: list[int], rows: list[int], order: tuple[int, ...], digits: list[int]):
+    """
+    The rows that are left for a partial transform, as they would be placed.
+    Equal for partial transforms that can only lead to the same grid.
+    """
+    used = set(rows)
+    used_bands = {row // 3 for row in rows}
+    band = rows[-1] // 3 if len(rows) % 3 else None
+
+    def row_keys(row):
+        # Unlabelled digits keep their own value, offset past the labels
+        keys = []
+        for column in order:
+            d = values[row * 9 + column]
+            keys.append(EMPTY if d == 0 else digits[d] or EMPTY + d)
+        return tuple(keys)
+
+    current = None
+    if band is not None:
+        current = frozenset(row_keys(r) for r in range(band * 3, band * 3 + 3) if r not in used)
+    bands = frozenset(
+        frozenset(row_keys(r) for r in range(b * 3, b * 3 + 3))
+        for b in range(3)
+        if b not in used_bands
+    )
+    return current, bands
+
+
+def _distinct(states: list, grids: tuple[list[int], list[int]]) -> list:
+    """Keep one of every group of partial transforms with the same remaining rows."""
+    distinct = []
+    seen = set()
+    for state in states:
+        orientation, rows, order, digits, _ = state
+        key = _remaining(grids[orientation], rows, order, digits)
+        if key not in seen:
+            seen.add(key)
+            distinct.append(state)
+    return distinct
+
+
+def canonical_form(values: list[int]) -> tuple[str, Transform]:
+    """
+    Find the canonical form of a puzzle, see the module docstring.
+
+    Args:
+        values: The 81 values of the puzzle in row-major order, 0 for an empty cell.
+
+    Returns:
+        tuple[str, Transform]: The canonical form as 81 characters with "." for empty cells,
+            and the transform from the puzzle to it.
+    """
+    grids = (list(values), [values[i] for i in TRANSPOSED])
+
+    # First row: only the positions of the givens matter
+    best = None
+    states = []
+    for orientation, grid in enumerate(grids):
+        for row in range(9):
+            givens = sum(1 << column for column in range(9) if grid[row * 9 + column])
+            keys, orders = _first_row_orders(givens)
+            if best is not None and keys > best:
+                continue
+            if best is None or keys < best:
+                best, states = keys, []
+            for order in orders:
+                digits = [0] * 10
+                label = 0
+                for column in order:
+                    d = grid[row * 9 + column]
+                    if d:
+                        label += 1
+                        digits[d] = label
+                states.append((orientation, [row], order, digits, label))
+    output = [best]
+    states = _distinct(states, grids)
+
+    # Next rows: extend every partial transform with the rows it can take next
+    for step in range(1, 9):
+        best = None
+        extended = []
+        for orientation, rows, order, digits, label in states:
+            grid = grids[orientation]
+            if step % 3:
+                band = rows[-1] // 3
+                choices = [r for r in range(band * 3, band * 3 + 3) if r not in rows]
+            else:
+                used_bands = {r // 3 for r in rows}
+                choices = [r for r in range(9) if r // 3 not in used_bands]
+            for row in choices:
+                new_digits = digits
+                new_label = label
+                keys = []
+                for column in order:
+                    d = grid[row * 9 + column]
+                    if d == 0:
+                        keys.append(EMPTY)
+                        continue
+                    if not new_digits[d]:
+                        if new_digits is digits:
+                            new_digits = digits.copy()
+                        new_label += 1
+                        new_digits[d] = new_label
+                    keys.append(new_digits[d])
+                keys = tuple(keys)
+                if best is not None and keys > best:
+                    continue
+                if best is None or keys < best:
+                    best, extended = keys, []
+                extended.append((orientation, rows + [row], order, new_digits, new_label))
+        output.append(best)
+        states = _distinct(extended, grids) if step < 8 else extended
+
+    orientation, rows, order, digits, label = states[0]
+    # Digits that are not in the puzzle get the remaining labels in order
+    for d in range(1, 10):
+        if not digits[d]:
+            label += 1
+            digits[d] = label
+    transform = Transform(bool(orientation), tuple(rows), order, tuple(digits))
+    string = "".join("." if key == EMPTY else str(key) for keys in output for key in keys)
+    return string, transform
@@ -0,0 +1,119 @@
+"""
+Command line interface: solve puzzles from files or stdin, one per line.
+
+Results are written as NDJSON (or CSV) as soon as they are ready (also with --workers),
+so a single command can serve a long-running pipeline.
+
+Example:
+
+```
+sudoku-solver puzzles.txt.gz --workers 8 > solutions.ndjson
+cat puzzles.txt | sudoku-solver --strategies single_candidates,single_position
+sudoku-solver puzzles.txt --benchmark
+```
+"""
+
+from typing import List
+import argparse
+import json
+import os
+import sys
+import time
+
+from sudoku_solver_tim.strategies import STRATEGIES
+from sudoku_solver_tim.strategies.master.brute_force import brute_force
+from sudoku_solver_tim.stream import iter_solve, read_puzzles, write_csv, write_ndjson
+
+STRATEGIES_BY_NAME = {strategy.__name__: strategy for strategy in STRATEGIES}
+
+
+def _strategies(value: str) -> list:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STRATEGIES_BY_NAME]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown strategies {', '.join(unknown)} (choose from {', '.join(STRATEGIES_BY_NAME)})"
+        )
+    return [STRATEGIES_BY_NAME[name] for name in names]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sudoku-solver",
+        description="Solve sudoku puzzles, one 81 character puzzle per line (. or 0 for an empty cell).",
+    )
+    parser.add_argument(
+        "files", nargs="*", default=["-"], help="Files with puzzles, optionally gzipped. Reads stdin by default or for -."
+    )
+    parser.add_argument("-o", "--output", default="-", help="File to write the results to. Defaults to stdout.")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson", help="Output format.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument("--chunksize", type=int, default=64, help="Puzzles sent to a worker at a time.")
+    parser.add_argument(
+        "--strategies",
+        type=_strategies,
+        help="Comma separated strategies to use, for example single_candidates,single_position. Defaults to all.",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Only use brute force: the fastest way to a solution, but strategies_used says nothing about difficulty.",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Only write a summary with the number of puzzles solved per second."
+    )
+    return parser
+
+
+def _puzzles(files: List[str]):
+    for name in files:
+        yield from read_puzzles(sys.stdin.buffer if name == "-" else name)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    strategies = [brute_force] if args.fast else args.strategies
+
+    start = time.perf_counter()
+    try:
+        results = iter_solve(_puzzles(args.files), workers=args.workers, chunksize=args.chunksize, strategies=strategies)
+    except ValueError as e:
+        parser.error(str(e))
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="" if args.format == "csv" else None)
+    if out is sys.stdout:
+        # Write every result as soon as it is ready, also when stdout is a pipe
+        sys.stdout.reconfigure(line_buffering=True)
+    try:
+        if args.benchmark:
+            n = solved = 0
+            for result in results:
+                n += 1
+                solved += result.solved
+            seconds = time.perf_counter() - start
+            summary = {
+                "puzzles": n,
+                "solved": solved,
+                "seconds": round(seconds, 3),
+                "per_second": round(n / seconds, 1) if seconds else None,
+                "workers": args.workers,
+            }
+            out.write(json.dumps(summary) + "\n")
+        elif args.format == "csv":
+            write_csv(results, out)
+        else:
+            write_ndjson(results, out)
+    except BrokenPipeError:
+        # The reader stopped early, for example `| head`.
+        # Point stdout at devnull, so that flushing it at exit doesn't raise again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
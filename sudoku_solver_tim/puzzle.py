@@ -1,126 +1,369 @@
-from rich.panel import Panel
-from rich.console import Console
-from rich.layout import Layout
-from rich.table import Table
-from rich.align import Align
-from rich import box
+from typing import TYPE_CHECKING, List, Callable, Literal, Iterable, Iterator
 
-from typing import List, Callable, Literal
-
-from functools import lru_cache
+from collections.abc import MutableSet
+from functools import cache, cached_property
 from itertools import chain
+import weakref
+
+from sudoku_solver_tim.bitmask import (
+    ALL_CELLS,
+    ALL_DIGITS,
+    BIT,
+    BIT_TO_DIGIT,
+    DIGITS,
+    POPCOUNT,
+    bit_indices,
+    to_mask,
+)
+from sudoku_solver_tim.canonical import Transform, canonical_form
+from sudoku_solver_tim.strategies import STRATEGIES, SUBSCRIPTIONS
+from sudoku_solver_tim.strategies.master.brute_force import SEARCHES, count_solutions, puzzle_masks
+from sudoku_solver_tim.topology import (
+    BLOCKCOLUMN_BLOCKS,
+    BLOCKCOLUMN_CELLS,
+    BLOCKROW_BLOCKS,
+    BLOCKROW_CELLS,
+    BLOCK_UNIT,
+    BLOCKS,
+    CELL_BLOCK,
+    CELL_POSITIONS,
+    CELL_UNITS,
+    COLUMN_UNIT,
+    COLUMNS,
+    PEERS,
+    ROWS,
+    UNITS,
+)
+
+
+@cache
+def _console():
+    """
+    The rich console, created on first use.
+    rich is only imported to show a puzzle, so that importing the package stays fast.
+    """
+    from rich.console import Console
+    return Console()
+
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.cache import SolveCache
+
+
+class Markup(MutableSet):
+    """
+    Set-like view on the candidate mask of a cell.
+
+    Kept for callers that treat `Cell.markup` as a set of digits.
+    Changes made through the view are written back to `Cell.mask`.
+    """
+    __slots__ = ("_cell",)
+
+    def __init__(self, cell: "Cell") -> None:
+        self._cell = cell
 
-from sudoku_solver_tim.strategies import STRATEGIES
+    def __contains__(self, value) -> bool:
+        return isinstance(value, int) and 1 <= value <= 9 and bool(self._cell.mask & BIT[value])
 
-console = Console()
-layout = Layout()
-from rich.text import Text
+    def __iter__(self):
+        return iter(DIGITS[self._cell.mask])
+
+    def __len__(self) -> int:
+        return POPCOUNT[self._cell.mask]
+
+    def add(self, value: int) -> None:
+        self._cell._update_mask(self._cell.mask | BIT[value])
+
+    def discard(self, value: int) -> None:
+        self._cell._update_mask(self._cell.mask & ~BIT[value])
+
+    def __repr__(self) -> str:
+        if not self._cell.mask:
+            return "set()"
+        return "{" + ", ".join(str(d) for d in self) + "}"
 
 
 class Cell:
+    """
+    A single cell of the puzzle.
+
+    Cells of a Puzzle look up their groups through the puzzle and the shared topology tables.
+    Standalone cells (f.e. in tests) keep the groups they were created with.
+
+    A cell only holds a weak reference to its puzzle, so a puzzle is freed
+    by reference counting as soon as it is no longer used. Keep a reference to the puzzle
+    while using its cells: a cell of a freed puzzle raises a ReferenceError.
+    """
+    __slots__ = ("value", "row_id", "col_id", "index", "mask", "_puzzle", "_groups")
+
     def __init__(
             self,
             value,
             row_id,
             col_id,
-            block,
-            row,
-            column,
-            blockrow,
-            blockcolumn,
-            puzzle = None, # for debugging
+            block = None,
+            row = None,
+            column = None,
+            blockrow = None,
+            blockcolumn = None,
+            puzzle = None,
         ) -> None:
         self.value = value
         self.row_id = row_id
         self.col_id = col_id
-
-        self.block = block or Block(0)
-        self.row = row or Row(0)
-        self.column = column or Column(0)
-        self.blockrow = blockrow or BlockRow(0, [])
-        self.blockcolumn = blockcolumn or BlockColumn(0, [])
-        self.puzzle = puzzle or None # for debugging
-        
-        self.markup: set = set(range(1,10)) if value == 0 else set()
+        # Position in Puzzle.cells and bit in Puzzle.bitboards
+        self.index = row_id * 9 + col_id
+        self._puzzle = weakref.ref(puzzle) if puzzle is not None else None
+
+        if puzzle is None:
+            self._groups = (
+                block or Block(0),
+                row or Row(0),
+                column or Column(0),
+                blockrow or BlockRow(0, []),
+                blockcolumn or BlockColumn(0, []),
+            )
+
+        # Candidates as a 9-bit mask, see sudoku_solver_tim.bitmask
+        self.mask: int = ALL_DIGITS if value == 0 else 0
 
     def __repr__(self) -> str:
         return f"Cell(value={self.value}, row_id={self.row_id}, col_id={self.col_id})"
 
+    @property
+    def puzzle(self) -> "Puzzle | None":
+        """
+        The puzzle of the cell, or None for a standalone cell.
+
+        Raises:
+            ReferenceError: When the puzzle of the cell was freed.
+        """
+        return self._owner() if self._puzzle is not None else None
+
+    def _owner(self) -> "Puzzle":
+        puzzle = self._puzzle()
+        if puzzle is None:
+            raise ReferenceError(
+                f"The puzzle of cell row {self.row_id+1}, column {self.col_id+1} was freed. "
+                "Keep a reference to the Puzzle while using its cells."
+            )
+        return puzzle
+
+    @property
+    def block(self) -> "Block":
+        if self._puzzle is None:
+            return self._groups[0]
+        return self._owner().blocks[CELL_BLOCK[self.index]]
+
+    @property
+    def row(self) -> "Row":
+        if self._puzzle is None:
+            return self._groups[1]
+        return self._owner().rows[self.row_id]
+
+    @property
+    def column(self) -> "Column":
+        if self._puzzle is None:
+            return self._groups[2]
+        return self._owner().columns[self.col_id]
+
+    @property
+    def blockrow(self) -> "BlockRow":
+        if self._puzzle is None:
+            return self._groups[3]
+        return self._owner().blockrows[self.row_id // 3]
+
+    @property
+    def blockcolumn(self) -> "BlockColumn":
+        if self._puzzle is None:
+            return self._groups[4]
+        return self._owner().blockcolumns[self.col_id // 3]
+
+    @property
+    def peers(self) -> List["Cell"]:
+        """
+        The other cells in the same row, column and block.
+        """
+        if self._puzzle is None:
+            cells = chain(self.row.cells, self.column.cells, self.block.cells)
+            return [c for c in cells if c is not self]
+        cells = self._owner().cells
+        return [cells[i] for i in PEERS[self.index]]
+
+    @property
+    def markup(self) -> Markup:
+        """
+        Candidates of the cell as a set-like view on `mask`.
+        """
+        return Markup(self)
+
+    @markup.setter
+    def markup(self, values: Iterable[int]) -> None:
+        self._update_mask(to_mask(values))
+
+    def _update_mask(self, mask: int) -> None:
+        """
+        Overwrite the candidate mask, keeping the puzzle bitboards in sync.
+        """
+        puzzle = self.puzzle
+        old_mask = self.mask
+        self.mask = mask
+        if puzzle is not None:
+            # Only real changes advance the journal and count as events
+            added = mask & ~old_mask
+            removed = old_mask & ~mask
+            if added:
+                puzzle._add_candidates(self, added)
+            if removed:
+                puzzle._remove_candidates(self, removed)
+
     @property
     def is_solved(self):
         return self.value != 0
 
-    def set_solution(self, value):
+    def set_solution(self, value: int = 0, mask: int = 0):
+        """
+        Solve the cell and remove the value from the markup of its peers.
+
+        Args:
+            value: The digit to set.
+            mask: Alternatively, the mask with the single bit of the digit to set.
+        """
+        if mask:
+            value = BIT_TO_DIGIT[mask]
+        bit = BIT[value]
 
         # Validate that value is not the solution of any other cell in the same row, column and block.
-        cells_to_update = chain(self.row.cells, self.column.cells, self.block.cells)
-        cells_to_update = [c for c in cells_to_update if c != self]
+        cells_to_update = self.peers
         for o in cells_to_update:
             assert o.value != value
-        
+
         # Update the value and markup
+        removed = self.mask
+        was_solved = self.value != 0
         self.value = value
-        self.markup = set()
+        self.mask = 0
+        if self._puzzle is not None:
+            puzzle = self._owner()
+            if not was_solved:
+                puzzle.unsolved -= 1
+                puzzle.events["solved"] += 1
+            puzzle._remove_candidates(self, removed)
 
         # Remove the value from the markup of all other cells in the same row, column and block.
         for o in cells_to_update:
-            o.remove_markup(self.value)
+            o.remove_markup(mask=bit)
 
         return self
 
-    def remove_markup(self, value: set[int] | list[int] | int):
-        if isinstance(value, int):
-            value = [value]
-        updates = False
-        for v in value:
-            if v not in self.markup:
-                continue
-            if len(self.markup) == 1:
-                raise Exception(f"Removing last markup value {v} from cell row {self.row_id+1}, column {self.col_id+1}")
-            updates = True
-            self.markup.remove(v)
-        return updates
-    
-    
+    def remove_markup(self, value: set[int] | list[int] | int | None = None, mask: int = 0):
+        """
+        Remove candidates from the cell.
+
+        Args:
+            value: A digit or collection of digits to remove.
+            mask: Alternatively, a mask of digits to remove.
+
+        Returns:
+            bool: Whether any candidate was removed.
+        """
+        if value is not None:
+            mask |= to_mask(value)
+        mask &= self.mask
+        if not mask:
+            return False
+        if mask == self.mask:
+            raise Exception(f"Removing last markup value {DIGITS[mask][-1]} from cell row {self.row_id+1}, column {self.col_id+1}")
+        puzzle = self.puzzle
+        self.mask ^= mask
+        if puzzle is not None:
+            puzzle._remove_candidates(self, mask)
+        return True
+
+
     def show_markup(self, highlight: int | None = None):
         """
         Return printable markup status.
         """
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+
         if self.value != 0:
             return Panel(Align(Text(str(self.value), justify="center", style="bold"), align="center", vertical="middle"), height=5, width=9)
         cell = Table(show_header=False, box=None, collapse_padding=True, pad_edge=False, show_edge=False)
 
         def v(value):
-            return str(value) if value in self.markup else ""
+            return str(value) if self.mask & BIT[value] else ""
         
         cell.add_row(v(1), v(2), v(3))
         cell.add_row(v(4), v(5), v(6))
         cell.add_row(v(7), v(8), v(9))
-        color = "#b76e79" if highlight not in self.markup else "#FFD700"
+        color = "#FFD700" if highlight and self.mask & BIT[highlight] else "#b76e79"
         return Panel(cell, style=color)
 
     
     def show_value(self):
+        from rich.text import Text
         text = Text(str(self.value) if self.value != 0 else " ", justify="center", style="on green")
         return text
 
+
+def _distinct_groups(groups) -> list:
+    """
+    Return the distinct groups, sorted by id.
+    """
+    return sorted({id(g): g for g in groups}.values(), key=lambda g: g.id)
+
+
 class Group:
     """
     BaseClass for a container holding 9 cells.
+
+    Groups of a Puzzle hold their cells and, like the cells, only a weak reference to the puzzle.
     """
-    def __init__(self, id) -> None:
+    __slots__ = ("id", "cells", "_puzzle")
+
+    # Offset of this kind of group in topology.UNITS (rows, columns, blocks)
+    unit_offset = 0
+
+    def __init__(self, id, cells: List[Cell] | None = None, puzzle: "Puzzle | None" = None) -> None:
         self.id = id
-        self.cells = []
+        self.cells = cells if cells is not None else []
+        self._puzzle = weakref.ref(puzzle) if puzzle is not None else None
+
+    @property
+    def puzzle(self) -> "Puzzle | None":
+        """
+        The puzzle of the group, or None for a standalone group.
+
+        Raises:
+            ReferenceError: When the puzzle of the group was freed.
+        """
+        if self._puzzle is None:
+            return None
+        puzzle = self._puzzle()
+        if puzzle is None:
+            raise ReferenceError(
+                f"The puzzle of {type(self).__name__}(id={self.id}) was freed. "
+                "Keep a reference to the Puzzle while using its groups."
+            )
+        return puzzle
 
     @property
     def unsolved_values(self):
         """
         Return set of unsolved values across the 9 cells.
         """
-        unsolved_values = set()
+        puzzle = self.puzzle
+        if puzzle is not None:
+            positions = puzzle.unit_positions[self.unit_offset + self.id]
+            return {d for d in range(1, 10) if positions[d]}
+        mask = 0
         for cell in self.cells:
-            unsolved_values.update(cell.markup)
-        return unsolved_values
+            mask |= cell.mask
+        return set(DIGITS[mask])
     
     def __iter__(self):
         """
@@ -130,57 +373,60 @@ class Group:
         """
         return iter(self.cells)
 
+    # The related groups below are looked up through the cells on every access.
+    # For cells of a Puzzle that is an index into the shared topology tables,
+    # so there is no need for a cache (which would keep groups and their puzzles alive).
+
     @property
-    @lru_cache
     def rows(self):
         assert len(self.cells) > 0
-        return sorted(list(set([c.row for c in self.cells])), key=lambda row: row.id)
-    
+        return _distinct_groups(c.row for c in self.cells)
+
     @property
-    @lru_cache
     def columns(self):
         assert len(self.cells) > 0
-        return sorted(list(set([c.column for c in self.cells])), key=lambda column: column.id)
+        return _distinct_groups(c.column for c in self.cells)
 
     @property
-    @lru_cache
     def blocks(self):
         assert len(self.cells) > 0
-        return sorted(list(set([c.block for c in self.cells])), key=lambda block: block.id)
+        return _distinct_groups(c.block for c in self.cells)
 
 
 class Block(Group):
-    id: int
+    __slots__ = ()
+    unit_offset = BLOCK_UNIT
 
     @property
-    @lru_cache
     def blockrow(self):
         # Which blockrow is this block part of?
-        assert len(set([c.blockrow for c in self.cells])) == 1
-        return [c.blockrow for c in self.cells][0]
-    
+        blockrows = _distinct_groups(c.blockrow for c in self.cells)
+        assert len(blockrows) == 1
+        return blockrows[0]
+
     @property
-    @lru_cache
     def blockcolumn(self):
         # Which blockcolumn is this block part of?
-        assert len(set([c.blockcolumn for c in self.cells])) == 1
-        return [c.blockcolumn for c in self.cells][0]
+        blockcolumns = _distinct_groups(c.blockcolumn for c in self.cells)
+        assert len(blockcolumns) == 1
+        return blockcolumns[0]
 
     @property
-    @lru_cache
     def other_blocks_in_row(self):
         other_blocks_in_row = [b for b in self.blockrow.blocks if b != self]
         assert len(other_blocks_in_row) == 2
         return other_blocks_in_row
     
     @property
-    @lru_cache
     def other_blocks_in_column(self):
         other_blocks_in_column = [b for b in self.blockcolumn.blocks if b != self]
         assert len(other_blocks_in_column) == 2
         return other_blocks_in_column
 
     def show_values(self):
+        from rich import box
+        from rich.table import Table
+
         # block = Table(show_header=False, width=18, box=box.HEAVY_EDGE, collapse_padding=False, pad_edge=False, padding=False, show_edge=True, show_lines=True)
         block = Table.grid(padding=0)
         block.box = box.HEAVY_EDGE
@@ -197,6 +443,9 @@ class Block(Group):
         return block
 
     def show_markup(self, highlight: int | None = None):
+        from rich.panel import Panel
+        from rich.table import Table
+
         # block = Table(show_header=False, box=None, collapse_padding=True, pad_edge=False, show_edge=False)
         block = Table.grid(expand=True, collapse_padding=False)
         block.add_row(self.cells[0].show_markup(highlight), self.cells[1].show_markup(highlight), self.cells[2].show_markup(highlight))
@@ -209,6 +458,11 @@ class Block(Group):
         return Panel(block, box=box.MINIMAL)
     
     def __repr__(self):
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+
         table = Table(show_header=False, box=None, padding=0, show_edge=False, leading=0)
         # v = 
 
@@ -222,35 +476,38 @@ class Block(Group):
         table.add_row(v(3), v(4), v(5))
         table.add_row(v(6), v(7), v(8))
         table.padding = (0, 1, 0, 0)
-        console.print(table)
+        _console().print(table)
         return f"Block(id={self.id})"
 
 
 class Row(Group):
+    __slots__ = ()
 
     @property
-    @lru_cache
     def blockrows(self):
         assert len(self.blocks) == 3
-        blockrows = sorted(list(set([c.blockrow for c in self.cells])), key=lambda blockrow: blockrow.id)
+        blockrows = _distinct_groups(c.blockrow for c in self.cells)
         assert len(blockrows) == 1
         return blockrows
 
 class Column(Group):
+    __slots__ = ()
+    unit_offset = COLUMN_UNIT
 
     @property
-    @lru_cache
     def blockrows(self):
         assert len(self.blocks) == 3
-        blockcolumns = sorted(list(set([c.blockcolumn for c in self.cells])), key=lambda blockcolumn: blockcolumn.id)
+        blockcolumns = _distinct_groups(c.blockcolumn for c in self.cells)
         assert len(blockcolumns) == 1
         return blockcolumns
 
 
 class BlockRow:
-    def __init__(self, id, blocks) -> None:
+    __slots__ = ("id", "cells", "blocks")
+
+    def __init__(self, id, blocks, cells: List[Cell] | None = None) -> None:
         self.id = id
-        self.cells = []
+        self.cells = cells if cells is not None else []
         self.blocks = blocks
 
     @property
@@ -260,9 +517,11 @@ class BlockRow:
     
 
 class BlockColumn:
-    def __init__(self, id, blocks) -> None:
+    __slots__ = ("id", "cells", "blocks")
+
+    def __init__(self, id, blocks, cells: List[Cell] | None = None) -> None:
         self.id = id
-        self.cells = []
+        self.cells = cells if cells is not None else []
         self.blocks = blocks
 
     @property
@@ -282,6 +541,12 @@ class Puzzle:
     puzzle = Puzzle()
     puzzle
     ```
+
+    Memory budget: a puzzle takes at most 24 kB, and at most 40 kB once its
+    row, column and block objects have been built (see tests/test_memory.py).
+    The object graph has no reference cycles (cells and groups only hold a weak reference to the puzzle),
+    so a puzzle is freed by reference counting as soon as it goes out of scope.
+    Its cells and groups raise a ReferenceError when they are used after that.
     """
 
     @classmethod
@@ -310,65 +575,225 @@ class Puzzle:
         self._grid = grid
 
         self.strategies_used = set()
-        self.cells = []
-        self.blocks = [Block(id) for id in range(9)]
-        self.rows = [Row(id) for id in range(9)]
-        self.columns = [Column(id) for id in range(9)]
-       
-        # Add BlockRows and BlockColumns
+        # Names of the strategies that made progress, in the order they did, see solve()
+        self.steps = []
+        self.cells = [
+            Cell(value=value, row_id=row_id, col_id=col_id, puzzle=self)
+            for row_id, row in enumerate(grid)
+            for col_id, value in enumerate(row)
+        ]
+
+        # Remove the given values from the markup of their peers
+        cells = self.cells
+        for cell in cells:
+            if cell.value != 0:
+                bit = BIT[cell.value]
+                for i in PEERS[cell.index]:
+                    peer = cells[i]
+                    assert peer.value != cell.value
+                    peer.mask &= ~bit
+        for cell in cells:
+            if cell.value == 0 and cell.mask == 0:
+                raise Exception(f"No markup values left for cell row {cell.row_id+1}, column {cell.col_id+1}")
+
+        # Change journal: every candidate change advances the clock
+        # and stamps the units and digits it touched with the new time.
+        # Strategies record the time of their last scan in last_scans, see dirty_units() and dirty_digits().
+        self.clock = 0
+        self.unit_stamps = [0] * 27
+        self.digit_stamps = [0] * 10
+        self.last_scans = {}
+
+        # Number of times each kind of change happened, see strategies.SUBSCRIPTIONS
+        self.events = {"naked_single": 0, "eliminated": 0, "bivalue": 0, "solved": 0}
+        # Strategy calls Puzzle.solve skipped because none of their events happened
+        self.skipped_invocations = 0
+
+        # Per-digit bitboards: bit i of bitboards[d] is set when cell i can hold digit d.
+        # bitboards[0] is unused, so that bitboards[d] can be indexed by digit.
+        self.bitboards = [0] * 10
+        # Per-unit digit positions: bit k of unit_positions[u][d] is set when
+        # the k-th cell of topology.UNITS[u] can hold digit d (index 0 is unused again).
+        # A digit with a single position in a unit is a hidden single.
+        self.unit_positions = [[0] * 10 for _ in range(27)]
+        for cell in cells:
+            self._add_candidates(cell, cell.mask)
+
+        # Worklist of cells (by index) that are down to a single candidate.
+        # Filled as candidates are removed, and drained by the single candidates strategy.
+        self.naked_singles = [cell.index for cell in cells if POPCOUNT[cell.mask] == 1]
+
+        # Number of empty cells, kept up to date by Cell.set_solution
+        self.unsolved = sum(1 for cell in cells if cell.value == 0)
+
+        # Search used by the brute force strategy, see strategies.master.brute_force.SEARCHES
+        self.search_backend = "backtrack"
+
+    # The groups are built on first use from the shared topology tables,
+    # so puzzles that are only solved through the tables never create them.
+
+    @cached_property
+    def rows(self) -> List[Row]:
+        return [Row(id, [self.cells[i] for i in cells], self) for id, cells in enumerate(ROWS)]
+
+    @cached_property
+    def columns(self) -> List[Column]:
+        return [Column(id, [self.cells[i] for i in cells], self) for id, cells in enumerate(COLUMNS)]
+
+    @cached_property
+    def blocks(self) -> List[Block]:
+        return [Block(id, [self.cells[i] for i in cells], self) for id, cells in enumerate(BLOCKS)]
+
+    @cached_property
+    def blockrows(self) -> List[BlockRow]:
         # Basically a 3x3 grid of blocks
-        self.blockrows = [
-            BlockRow(0, [self.blocks[0],self.blocks[1],self.blocks[2]]),
-            BlockRow(1, [self.blocks[3],self.blocks[4],self.blocks[5]]),
-            BlockRow(2, [self.blocks[6],self.blocks[7],self.blocks[8]])
+        return [
+            BlockRow(id, [self.blocks[b] for b in blocks], [self.cells[i] for i in BLOCKROW_CELLS[id]])
+            for id, blocks in enumerate(BLOCKROW_BLOCKS)
         ]
-        self.blockcolumns = [
-            BlockColumn(0, [self.blocks[0],self.blocks[3],self.blocks[6]]),
-            BlockColumn(1, [self.blocks[1],self.blocks[4],self.blocks[7]]),
-            BlockColumn(2, [self.blocks[2],self.blocks[5],self.blocks[8]])
+
+    @cached_property
+    def blockcolumns(self) -> List[BlockColumn]:
+        return [
+            BlockColumn(id, [self.blocks[b] for b in blocks], [self.cells[i] for i in BLOCKCOLUMN_CELLS[id]])
+            for id, blocks in enumerate(BLOCKCOLUMN_BLOCKS)
         ]
 
-        # Create the cells
-        for row_id, row in enumerate(self._grid):
-            for col_id, value in enumerate(row):
-
-                # Calculate the block_id (blocks 0-8 from top left to bottom right)
-                block_id = (row_id // 3) * 3 + (col_id // 3)
-                blockrow_id = row_id // 3
-                blockcolumn_id = col_id // 3
-
-                cell = Cell(
-                    value=value,
-                    row_id=row_id,
-                    col_id=col_id,
-                    block=self.blocks[block_id],
-                    row=self.rows[row_id],
-                    column=self.columns[col_id],
-                    blockrow=self.blockrows[blockrow_id],
-                    blockcolumn=self.blockcolumns[blockcolumn_id],
-                    puzzle=self
-                )
-                self.cells.append(cell)
-
-                self.blocks[block_id].cells.append(cell)
-                self.rows[row_id].cells.append(cell)
-                self.columns[col_id].cells.append(cell)
-                self.blockrows[blockrow_id].cells.append(cell)
-                self.blockcolumns[blockcolumn_id].cells.append(cell)
-
-        # Update the cells
-        for cell in self.cells:
-            # for debugging
-            cell.puzzle = self
-            # Update the solved cells
-            if cell.value != 0:
-                cell.set_solution(cell.value)
+    def _remove_candidates(self, cell: Cell, mask: int) -> None:
+        """
+        Bookkeeping after the digits in `mask` were removed from the candidates of `cell`.
+        """
+        index = cell.index
+        clear = ~(1 << index)
+        bitboards = self.bitboards
+        digit_stamps = self.digit_stamps
+        row, column, block = CELL_UNITS[index]
+        row_pos, column_pos, block_pos = CELL_POSITIONS[index]
+        row_positions = self.unit_positions[row]
+        column_positions = self.unit_positions[column]
+        block_positions = self.unit_positions[block]
+        row_clear, column_clear, block_clear = ~(1 << row_pos), ~(1 << column_pos), ~(1 << block_pos)
+        self._stamp(row, column, block)
+        clock = self.clock
+        for d in DIGITS[mask]:
+            bitboards[d] &= clear
+            row_positions[d] &= row_clear
+            column_positions[d] &= column_clear
+            block_positions[d] &= block_clear
+            digit_stamps[d] = clock
+        events = self.events
+        events["eliminated"] += 1
+        candidates = POPCOUNT[cell.mask]
+        if candidates == 1:
+            self.naked_singles.append(cell.index)
+            events["naked_single"] += 1
+        elif candidates == 2:
+            events["bivalue"] += 1
+
+    def _add_candidates(self, cell: Cell, mask: int) -> None:
+        """
+        Bookkeeping after the digits in `mask` were added to the candidates of `cell`.
+        """
+        index = cell.index
+        bit = 1 << index
+        bitboards = self.bitboards
+        units = CELL_UNITS[index]
+        positions = CELL_POSITIONS[index]
+        self._stamp(*units)
+        for d in DIGITS[mask]:
+            bitboards[d] |= bit
+            self.digit_stamps[d] = self.clock
+            for unit, pos in zip(units, positions):
+                self.unit_positions[unit][d] |= 1 << pos
+
+    def _stamp(self, row: int, column: int, block: int) -> None:
+        """
+        Advance the journal clock and mark the units of a changed cell.
+        """
+        self.clock += 1
+        unit_stamps = self.unit_stamps
+        unit_stamps[row] = unit_stamps[column] = unit_stamps[block] = self.clock
+
+    def dirty_units(self, key: str) -> List[int]:
+        """
+        Return the units (indices into topology.UNITS) that changed since the last scan recorded under `key`,
+        and record a new scan.
+
+        Strategies that only look at one unit at a time can skip the other units,
+        as they would find the same nothing as last time.
+        Changes made during the scan get a later stamp, so those units are returned again next time.
+
+        Example:
+
+        ```python
+        for unit in puzzle.dirty_units("naked_pairs"):
+            ...  # examine UNITS[unit]
+        ```
+        """
+        since = self.last_scans.get(key, -1)
+        self.last_scans[key] = self.clock
+        return [unit for unit, stamp in enumerate(self.unit_stamps) if stamp > since]
+
+    def dirty_digits(self, key: str) -> List[int]:
+        """
+        Return the digits whose candidates changed since the last scan recorded under `key`,
+        and record a new scan. See `dirty_units()`.
+        """
+        since = self.last_scans.get(key, -1)
+        self.last_scans[key] = self.clock
+        return [d for d in range(1, 10) if self.digit_stamps[d] > since]
+
+    def candidate_cells(self, digit: int, unit_mask: int = ALL_CELLS) -> List[Cell]:
+        """
+        Return the unsolved cells that can hold `digit`, optionally restricted to a unit.
+
+        Example:
+
+        ```python
+        from sudoku_solver_tim.bitmask import ROW_MASKS
+        puzzle.candidate_cells(4, ROW_MASKS[0])  # cells in the first row that can be a 4
+        ```
+        """
+        cells = self.cells
+        return [cells[i] for i in bit_indices(self.bitboards[digit] & unit_mask)]
 
     @property
     def grid(self):
-        return [[c.value or 0 for c in row.cells] for row in self.rows]
+        return [[c.value for c in self.cells[i:i + 9]] for i in range(0, 81, 9)]
+
+    def to_string(self) -> str:
+        """
+        The puzzle as a string of 81 characters with . for an empty cell, see `from_string()`.
+        """
+        return "".join(str(c.value) if c.value else "." for c in self.cells)
+
+    def canonical_form(self) -> tuple[str, Transform]:
+        """
+        The canonical form of the puzzle: the same for all puzzles that are equal
+        up to relabelling digits, reordering rows and columns within the sudoku structure, and transposing.
+        See `sudoku_solver_tim.canonical`.
+
+        Example:
+
+        ```python
+        string, transform = puzzle.canonical_form()
+        canonical = Puzzle.from_string(string)
+        canonical.solve()
+        transform.revert(canonical.grid)  # the solution of puzzle
+        ```
+
+        Returns:
+            tuple[str, Transform]: The canonical form as a string (see `from_string()`),
+                and the transform that maps this puzzle to it.
+        """
+        return canonical_form([c.value for c in self.cells])
     
-    def solve(self, strategies: List[Callable] | None = None):
+    def solve(
+        self,
+        strategies: List[Callable] | None = None,
+        search: Literal["backtrack", "dlx"] | None = None,
+        cache: "SolveCache | None" = None,
+    ):
         """
         Solve the puzzle using the given strategies.
 
@@ -376,27 +801,47 @@ class Puzzle:
 
         Args:
             strategies: List of strategies to use. If no strategies are given, all strategies will be used.
+            search: The search backend of the brute force strategy:
+                "backtrack" (default) or "dlx" (exact cover).
+            cache: Look up the result in this cache first, and store it there after solving.
+                See `sudoku_solver_tim.cache.SolveCache`.
 
         Returns:
             True if the puzzle is solved, False otherwise.
         """
+        if cache is not None:
+            return cache.solve(self, strategies, search)
+        self.search_backend = self._search(search)
         if strategies is None:
             strategies = STRATEGIES
         # Ensure the right order of strategies
         strategies = [s for s in STRATEGIES if s in strategies]
 
+        events = self.events
+        subscriptions = [SUBSCRIPTIONS[strategy] for strategy in strategies]
+        # Per strategy, the counts of its events when it last made no progress
+        seen = [None] * len(strategies)
+
         # Keep trying strategies until the puzzle is solved
         # Note each strategy will repeat itself until no more cells are solved
         # If a strategy solves at least one cell, and it done with repeating, we move back to the first strategy
         while not self.is_solved():
             # Try each strategy in order of complexity
-            for strategy in strategies:
+            for i, strategy in enumerate(strategies):
+                counts = tuple(events[event] for event in subscriptions[i])
+                if counts == seen[i]:
+                    # Nothing the strategy depends on changed since it last came up empty
+                    self.skipped_invocations += 1
+                    continue
                 if strategy(self):
+                    self.steps.append(strategy.__name__)
                     break  # If strategy made progress, break out of for loop to restart from first strategy
+                seen[i] = counts
             else:  # If no strategy made any progress
                 break  # Break out of while loop as no progress can be made
 
         if self.is_solved():
+            # Strategies only ever place candidates, so one check at the end is enough
             self.validate()
             return True
         else:
@@ -413,25 +858,95 @@ class Puzzle:
 
         for strategy in strategies:
             if solved_cells := strategy(self):
-                console.print(f"Made progress using {strategy.__name__}")
+                self.steps.append(strategy.__name__)
+                _console().print(f"Made progress using {strategy.__name__}")
                 return solved_cells
         return False
 
+    def _search(self, search: str | None) -> str:
+        if search is None:
+            return self.search_backend
+        if search not in SEARCHES:
+            raise ValueError(f"Invalid search: {search}")
+        return search
+
+    def iter_solutions(self, search: Literal["backtrack", "dlx"] | None = None) -> Iterator[List[List[int]]]:
+        """
+        Yield the solutions of the puzzle one by one, as grids, without changing the puzzle.
+
+        The solutions are found lazily by the brute force search,
+        so only the current branch of the search is kept in memory.
+
+        Example:
+
+        ```python
+        for grid in puzzle.iter_solutions():
+            print(grid[0])
+        ```
+
+        Args:
+            search: The search backend, defaults to `self.search_backend`. See `solve()`.
+        """
+        for masks in SEARCHES[self._search(search)](puzzle_masks(self)):
+            values = [BIT_TO_DIGIT[mask] for mask in masks]
+            yield [values[i:i + 9] for i in range(0, 81, 9)]
+
+    def count_solutions(
+        self,
+        limit: int | None = 2,
+        search: Literal["backtrack", "dlx"] | None = None,
+        parallel: int | None = None,
+    ) -> int:
+        """
+        Count the solutions of the puzzle, without changing it.
+
+        The search starts from the current candidates and stops as soon as `limit` solutions are found,
+        so the default answers "none, one or more than one".
+
+        Example:
+
+        ```python
+        puzzle = Puzzle.from_string(string)
+        puzzle.count_solutions()  # 0, 1 or 2
+        ```
+
+        Args:
+            limit: The count to stop at. If None, all solutions are counted.
+            search: The search backend, defaults to `self.search_backend`. See `solve()`.
+            parallel: Count in this many processes, by splitting the search into subtrees.
+                Worth it for puzzles with many solutions, see `brute_force.count_solutions()`.
+
+        Returns:
+            int: The number of solutions, at most `limit`.
+        """
+        return count_solutions(puzzle_masks(self), limit, self._search(search), parallel)
+
+    def has_unique_solution(self) -> bool:
+        """
+        Whether the puzzle has exactly one solution, see `count_solutions()`.
+        """
+        return self.count_solutions(limit=2) == 1
+
     def is_solved(self):
-        if not all([c.value != 0 for c in self.cells]):
-            return False
-        self.validate()
-        return True
+        """
+        Whether every cell has a value. Use `validate()` to check the solution itself.
+        """
+        return self.unsolved == 0
 
     def validate(self):
         """
         The solution of a Sudoku puzzle requires that every row, column, and box contain all the numbers in the set
         [1, 2, . . . , 9] and that every cell be occupied by one
         and only one number.
+
+        With 9 cells per unit, that holds when the values of every unit cover all 9 digit bits.
         """
-        for group in chain(self.blocks, self.rows, self.columns):
-            solutions = [c.value for c in group.cells]
-            if not sorted(solutions) == list(range(1,10)):
+        values = [BIT[c.value] for c in self.cells]
+        for cells in UNITS:
+            mask = 0
+            for i in cells:
+                mask |= values[i]
+            if mask != ALL_DIGITS:
                 raise Exception("Invalid puzzle solution.")
 
     def get_lines(self, type: Literal["rows", "columns", "blocks"]):
@@ -446,24 +961,26 @@ class Puzzle:
     
     def _get_cell(self, row_id, col_id):
         """for debugging"""
-        return [c for c in self.cells if c.row_id == row_id and c.col_id == col_id][0]
+        return self.cells[row_id * 9 + col_id]
 
     def show_markup(self, highlight: int | None = None):
         from rich import box
+        from rich.table import Table
         table = Table(show_header=False, show_lines=True, box=box.MINIMAL, collapse_padding=False, pad_edge=False, show_edge=True)
         table.add_row(self.blocks[0].show_markup(highlight), self.blocks[1].show_markup(highlight), self.blocks[2].show_markup(highlight))
         table.add_row(self.blocks[3].show_markup(highlight), self.blocks[4].show_markup(highlight), self.blocks[5].show_markup(highlight))
         table.add_row(self.blocks[6].show_markup(highlight), self.blocks[7].show_markup(highlight), self.blocks[8].show_markup(highlight))
     
-        console.print(table)
+        _console().print(table)
 
 
     def __repr__(self):
+        from rich.table import Table
         table = Table(show_header=False, box=None, padding=0, show_edge=False, leading=0)
         table.add_row(self.blocks[0].show_values(), self.blocks[1].show_values(), self.blocks[2].show_values())
         table.add_row(self.blocks[3].show_values(), self.blocks[4].show_values(), self.blocks[5].show_values())
         table.add_row(self.blocks[6].show_values(), self.blocks[7].show_values(), self.blocks[8].show_values())
 
         table.padding = (0, 1, 0, 0)
-        console.print(table)
+        _console().print(table)
         return ""
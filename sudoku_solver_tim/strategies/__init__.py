@@ -11,6 +11,8 @@ from sudoku_solver_tim.strategies.advanced.naked_quads import naked_quads
 from sudoku_solver_tim.strategies.advanced.hidden_quads import hidden_quads
 from sudoku_solver_tim.strategies.master.x_wings import x_wings
 from sudoku_solver_tim.strategies.master.swordfish import swordfish
+from sudoku_solver_tim.strategies.master.jellyfish import jellyfish
+from sudoku_solver_tim.strategies.master.finned_fish import finned_fish
 from sudoku_solver_tim.strategies.master.brute_force import brute_force
 
 __all__ = [
@@ -27,6 +29,8 @@ __all__ = [
     "hidden_quads",
     "x_wings",
     "swordfish",
+    "jellyfish",
+    "finned_fish",
     "brute_force",
 ]
 
@@ -45,9 +49,38 @@ STRATEGIES = [
     hidden_quads,
     x_wings,
     swordfish,
+    jellyfish,
+    finned_fish,
     brute_force,
 ]
 
+# Events each strategy subscribes to, see Puzzle.events.
+# Puzzle.solve only re-runs a strategy that made no progress after one of its events happened.
+#
+# - "naked_single": a cell was added to the naked single worklist
+# - "eliminated": a candidate was removed (which includes solving a cell)
+# - "bivalue": a cell was left with 2 candidates
+# - "solved": a cell was solved
+SUBSCRIPTIONS = {
+    single_candidates: ("naked_single",),
+    single_position: ("eliminated",),
+    candidate_lines: ("eliminated",),
+    double_pairs: ("eliminated",),
+    multiple_lines: ("eliminated",),
+    # A new naked pair needs a cell that just became bivalue
+    naked_pairs: ("bivalue",),
+    naked_triples: ("eliminated",),
+    naked_quads: ("eliminated",),
+    hidden_pairs: ("eliminated",),
+    hidden_triples: ("eliminated",),
+    hidden_quads: ("eliminated",),
+    x_wings: ("eliminated",),
+    swordfish: ("eliminated",),
+    jellyfish: ("eliminated",),
+    finned_fish: ("eliminated",),
+    brute_force: ("eliminated",),
+}
+
 STRATEGY_NAMES = {
     "Single Candidate": single_candidates,
     "Single Position": single_position,
@@ -62,5 +95,13 @@ STRATEGY_NAMES = {
     "Hidden Quads": hidden_quads,
     "X-Wings": x_wings,
     "Swordfish": swordfish,
+    "Jellyfish": jellyfish,
+    "Finned Fish": finned_fish,
     "Brute Force": brute_force,
 }
+
+# Difficulty levels, in the order of the strategy packages
+LEVELS = ["easy", "medium", "advanced", "master"]
+
+# The level of each strategy: the package it is in
+STRATEGY_LEVELS = {strategy: strategy.__module__.split(".")[-2] for strategy in STRATEGIES}
@@ -3,8 +3,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sudoku_solver_tim.puzzle import Puzzle
 
-from itertools import combinations, chain
-import logging
+from sudoku_solver_tim.strategies.advanced.subsets import find_hidden_subsets, hidden_subsets
 
 
 def hidden_pairs(p: "Puzzle") -> bool:
@@ -16,19 +15,7 @@ def hidden_pairs(p: "Puzzle") -> bool:
     Returns:
         bool: Whether 1 or more cells have been updated.
     """
-    updates_found = 0
-
-    groups = list(chain(p.rows, p.columns, p.blocks))
-
-    for group in groups:
-        updates_found += len(_find_hidden_pairs(group))
-
-    if updates_found > 0:
-        logging.debug(f"Hidden pairs iteration updated {updates_found} cells.")
-        p.strategies_used.add("Hidden Pairs")
-        return True
-
-    return False
+    return hidden_subsets(p, 2, "Hidden Pairs")
 
 
 def _find_hidden_pairs(group):
@@ -44,32 +31,4 @@ def _find_hidden_pairs(group):
     Returns:
         list: List of cells that were updated
     """
-    updated_cells = []
-
-    # Get all unsolved cells
-    unsolved_cells = [cell for cell in group if not cell.is_solved]
-
-    # Get all candidates from unsolved cells
-    all_candidates = set().union(*(cell.markup for cell in unsolved_cells))
-
-    # Check all possible pairs of candidates, f.e. {1,2}
-    for pair in combinations(all_candidates, 2):
-        # Find cells that contain any of these candidates
-        cells_with_pair = [
-            cell for cell in unsolved_cells if any(c in cell.markup for c in pair)
-        ]
-
-        # If exactly two cells contain these candidates, check if they are the only cells
-        if len(cells_with_pair) == 2:
-            # Check if any other cells contain these values
-            other_cells = [
-                cell for cell in unsolved_cells if cell not in cells_with_pair
-            ]
-            other_values = set(range(1, 10)) - set(pair)
-            if not any(any(c in cell.markup for c in pair) for cell in other_cells):
-                # We found a hidden pair - remove all other candidates from these cells
-                for cell in cells_with_pair:
-                    if cell.remove_markup(other_values):
-                        updated_cells.append(cell)
-
-    return updated_cells
+    return find_hidden_subsets(group, 2)
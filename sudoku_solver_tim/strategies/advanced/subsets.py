@@ -0,0 +1,173 @@
+"""
+Shared engine for the naked and hidden subset strategies (pairs, triples and quads).
+
+A naked subset of size k is a set of k unsolved cells in a unit
+whose candidates together contain only k digits.
+Those digits must go in those cells, so they can be removed from the other cells of the unit.
+
+A hidden subset of size k is a set of k digits that together can only go in k cells of a unit.
+Those cells must hold those digits, so all other candidates can be removed from them.
+
+Both are the same search: for naked subsets over the candidate mask of each cell,
+for hidden subsets over the position mask of each digit (`Puzzle.unit_positions`).
+"""
+
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.puzzle import Cell, Puzzle
+
+import logging
+
+from sudoku_solver_tim.bitmask import ALL_DIGITS, BIT, POPCOUNT, to_mask
+from sudoku_solver_tim.topology import UNITS
+
+
+def locked_sets(masks: Sequence[int], size: int) -> list[tuple[tuple[int, ...], int]]:
+    """
+    Find all combinations of `size` masks whose union has exactly `size` bits.
+
+    Masks that are empty or have more than `size` bits can never be part of such a combination and are skipped.
+    The combinations are built one mask at a time,
+    and a partial combination is abandoned as soon as its union has more than `size` bits.
+
+    Args:
+        masks: 9-bit masks, f.e. the candidates of the cells of a unit.
+        size: The number of masks in a combination (2 for pairs, 3 for triples, 4 for quads).
+
+    Returns:
+        list: Tuples of (indices into `masks`, union of their masks).
+    """
+    options = [(i, mask) for i, mask in enumerate(masks) if 0 < POPCOUNT[mask] <= size]
+    found = []
+
+    def search(start: int, chosen: tuple[int, ...], union: int) -> None:
+        if len(chosen) == size:
+            if POPCOUNT[union] == size:
+                found.append((chosen, union))
+            return
+        # Leave enough options to complete the combination
+        for option in range(start, len(options) - (size - len(chosen)) + 1):
+            i, mask = options[option]
+            combined = union | mask
+            if POPCOUNT[combined] <= size:
+                search(option + 1, chosen + (i,), combined)
+
+    search(0, (), 0)
+    return found
+
+
+def find_naked_subsets(cells: Sequence["Cell"], size: int) -> list["Cell"]:
+    """
+    Find naked subsets of `size` cells and remove their candidates from the other cells.
+
+    Args:
+        cells: The 9 cells of a row, column or block.
+        size: The size of the subset.
+
+    Returns:
+        list: The cells that were updated, each listed once.
+    """
+    cells = list(cells)
+    masks = [cell.mask for cell in cells]
+    updated_cells = []
+
+    # Subsets found on the current masks stay valid while eliminating,
+    # as the candidates of their cells can only shrink.
+    for subset, union in locked_sets(masks, size):
+        for i, cell in enumerate(cells):
+            if i not in subset and cell.remove_markup(mask=union) and cell not in updated_cells:
+                updated_cells.append(cell)
+
+    return updated_cells
+
+
+def naked_subsets(p: "Puzzle", size: int, label: str) -> bool:
+    """
+    Apply the naked subset strategy of `size` on all units of a puzzle.
+
+    Units that did not change since the last scan are skipped, see `Puzzle.dirty_units()`.
+
+    Args:
+        p: The puzzle to solve.
+        size: The size of the subsets.
+        label: The name added to `p.strategies_used` when cells were updated.
+
+    Returns:
+        bool: Whether 1 or more cells have been updated.
+    """
+    updates_found = 0
+    cells = p.cells
+
+    for unit in p.dirty_units(label):
+        updates_found += len(find_naked_subsets([cells[i] for i in UNITS[unit]], size))
+
+    if updates_found > 0:
+        logging.debug(f"{label} iteration updated {updates_found} cells.")
+        p.strategies_used.add(label)
+        return True
+
+    return False
+
+
+def find_hidden_subsets(
+    cells: Sequence["Cell"], size: int, positions: Sequence[int] | None = None
+) -> list["Cell"]:
+    """
+    Find hidden subsets of `size` digits and remove the other candidates from their cells.
+
+    Args:
+        cells: The 9 cells of a row, column or block.
+        size: The size of the subset.
+        positions: Per digit (index 0 unused), the mask of positions in `cells` that can hold it.
+            Computed from the cells when not given.
+
+    Returns:
+        list: The cells that were updated, each listed once.
+    """
+    cells = list(cells)
+    if positions is None:
+        positions = [0] * 10
+        for k, cell in enumerate(cells):
+            for d in range(1, 10):
+                if cell.mask & BIT[d]:
+                    positions[d] |= 1 << k
+    updated_cells = []
+
+    # positions[1:] is indexed by digit - 1
+    for digits, union in locked_sets(positions[1:], size):
+        other_values = ALL_DIGITS & ~to_mask(d + 1 for d in digits)
+        for k, cell in enumerate(cells):
+            if union >> k & 1 and cell.remove_markup(mask=other_values) and cell not in updated_cells:
+                updated_cells.append(cell)
+
+    return updated_cells
+
+
+def hidden_subsets(p: "Puzzle", size: int, label: str) -> bool:
+    """
+    Apply the hidden subset strategy of `size` on all units of a puzzle.
+
+    Units that did not change since the last scan are skipped, see `Puzzle.dirty_units()`.
+
+    Args:
+        p: The puzzle to solve.
+        size: The size of the subsets.
+        label: The name added to `p.strategies_used` when cells were updated.
+
+    Returns:
+        bool: Whether 1 or more cells have been updated.
+    """
+    updates_found = 0
+    cells = p.cells
+
+    for unit in p.dirty_units(label):
+        unit_cells = [cells[i] for i in UNITS[unit]]
+        updates_found += len(find_hidden_subsets(unit_cells, size, p.unit_positions[unit]))
+
+    if updates_found > 0:
+        logging.debug(f"{label} iteration updated {updates_found} cells.")
+        p.strategies_used.add(label)
+        return True
+
+    return False
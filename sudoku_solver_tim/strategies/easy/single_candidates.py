@@ -1,57 +1,48 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from sudoku_solver_tim.puzzle import Cell, Puzzle
+    from sudoku_solver_tim.puzzle import Puzzle
 
-from typing import List
 import logging
 
+from sudoku_solver_tim.bitmask import POPCOUNT
+
 
 def single_candidates(p: "Puzzle") -> bool:
     """
     Applies single candidate strategy.
 
-    Checks each cell's markup.
+    Solves every cell that has only one candidate left.
+
+    Instead of scanning all cells, this drains `p.naked_singles`:
+    the puzzle adds a cell to that worklist whenever removing markup leaves it with one candidate.
+    Solving a cell removes its value from its peers, which can add new cells to the worklist,
+    so the work done is proportional to the number of changes.
 
     See:
 
     - https://www.sudokuoftheday.com/techniques/single-candidate
 
     Args:
-        cells (list): cells with known values to propagate.
+        p (Puzzle): The puzzle to solve.
 
     Returns:
         bool: Whether 1 or more cells have been solved.
     """
-    solution_found = False
-
-    # Do a first pass to see if we can solve any cells
-    newly_solved_cells = _single_candidate_iteration(p.cells)
-    if len(newly_solved_cells) > 0:
-        logging.debug(
-            f"Single Candidate iteration found {len(newly_solved_cells)} cells."
-        )
-        solution_found = True
+    solved_cells = 0
+    cells = p.cells
+    naked_singles = p.naked_singles
+
+    while naked_singles:
+        cell = cells[naked_singles.pop()]
+        # Entries can be stale, f.e. when another strategy solved the cell in the meantime
+        if not cell.is_solved and POPCOUNT[cell.mask] == 1:
+            cell.set_solution(mask=cell.mask)
+            solved_cells += 1
+
+    if solved_cells > 0:
+        logging.debug(f"Single Candidate found {solved_cells} cells.")
         p.strategies_used.add("Single Candidate")
+        return True
 
-    # Keep solving cells until we can't solve any more
-    while len(newly_solved_cells) > 0:
-        newly_solved_cells = _single_candidate_iteration(p.cells)
-        if len(newly_solved_cells) > 0:
-            logging.debug(
-                f"Single Candidate iteration found {len(newly_solved_cells)} cells."
-            )
-
-    return solution_found
-
-
-def _single_candidate_iteration(cells: List["Cell"]) -> List["Cell"]:
-    solved_cells = []
-    for cell in cells:
-        if cell.is_solved:
-            continue
-        if len(cell.markup) == 1:
-            solution = cell.markup.pop()
-            cell.set_solution(solution)
-            solved_cells.append(cell)
-    return solved_cells
+    return False
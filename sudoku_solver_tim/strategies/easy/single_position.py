@@ -1,17 +1,31 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from sudoku_solver_tim.puzzle import Cell, Puzzle
+    from sudoku_solver_tim.puzzle import Puzzle
 
-from itertools import chain
 import logging
 
+from sudoku_solver_tim.bitmask import BIT_TO_DIGIT, POPCOUNT
+from sudoku_solver_tim.topology import BLOCK_UNIT, COLUMN_UNIT, UNITS
+
+
+def _unit_name(unit: int) -> str:
+    if unit >= BLOCK_UNIT:
+        return f"Block {unit - BLOCK_UNIT}"
+    if unit >= COLUMN_UNIT:
+        return f"Column {unit - COLUMN_UNIT}"
+    return f"Row {unit}"
+
 
 def single_position(p: "Puzzle") -> bool:
     """
     Applies the single position strategy on all cells.
 
     For every row, column and block, if a value is only found in one cell, then that cell must be that value.
+
+    The puzzle keeps the positions of every digit in every unit as a 9-bit mask (`p.unit_positions`),
+    so a single position is a mask with exactly one bit set.
+
     See:
 
     - https://www.sudokuoftheday.com/techniques/single-position
@@ -20,22 +34,18 @@ def single_position(p: "Puzzle") -> bool:
         bool: Whether 1 or more cells have been solved.
     """
     solutions_found = False
+    cells = p.cells
 
-    # Check each group (rows, columns, blocks) for values that only appear in one cell's markup
-    for group in chain(p.rows, p.columns, p.blocks):
+    # Check each unit (rows, columns, blocks) for values that only appear in one cell's markup
+    for unit, unit_cells in enumerate(UNITS):
+        positions = p.unit_positions[unit]
         for value in range(1, 10):
-            # Find cells in this group that could contain this value
-            possible_cells = [
-                c for c in group.cells if not c.is_solved and value in c.markup
-            ]
-
-            # If only one cell could contain this value, that must be the solution
-            if len(possible_cells) == 1:
-                possible_cells[0].set_solution(value)
+            # The masks are updated in place, so this also sees solutions found earlier in the loop
+            position_mask = positions[value]
+            if POPCOUNT[position_mask] == 1:
+                cells[unit_cells[BIT_TO_DIGIT[position_mask] - 1]].set_solution(value)
                 solutions_found = True
-                logging.debug(
-                    f"Single Position found solution: value {value} in {group.__class__.__name__} {group.id}"
-                )
+                logging.debug(f"Single Position found solution: value {value} in {_unit_name(unit)}")
                 p.strategies_used.add("Single Position")
 
     return solutions_found
@@ -1,42 +1,233 @@
-from typing import TYPE_CHECKING, Literal, Optional, List
+"""
+Backtracking search on candidate masks.
+
+The search state is a list of 81 candidate masks (see sudoku_solver_tim.bitmask),
+where a solved cell is the mask of its value.
+It starts from the candidates the logical strategies left in the puzzle, and at every node:
+
+- propagates naked singles: a cell with one candidate removes it from its peers.
+- propagates hidden singles: a digit with one position in a unit is placed there.
+  Per unit, `once` collects the digits seen and `twice` the digits seen more than once,
+  so the hidden singles are `once & ~twice`.
+- branches on the unsolved cell with the fewest candidates.
+
+A contradiction (a cell without candidates, or a digit without a position) ends the branch
+by returning None instead of raising.
+
+The exact cover search in `dlx.py` can be used instead, see `SEARCHES` and `Puzzle.solve(search=...)`.
+"""
+
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
-    from sudoku_solver_tim.puzzle import Puzzle, Cell
+    from sudoku_solver_tim.puzzle import Puzzle
 
-import logging
-import copy
+from sudoku_solver_tim.bitmask import ALL_DIGITS, BIT, DIGITS, POPCOUNT
+from sudoku_solver_tim.strategies.master import dlx
+from sudoku_solver_tim.topology import PEERS, UNITS
 
 
-def is_valid(board, row, col, num):
-    # Check if 'num' is not in the current row, column and 3x3 subgrid
-    for i in range(9):
-        if board[row][i] == num or board[i][col] == num:
-            return False
-        if board[row // 3 * 3 + i // 3][col // 3 * 3 + i % 3] == num:
-            return False
-    return True
+def puzzle_masks(puzzle: "Puzzle") -> list[int]:
+    """
+    Return the search state of a puzzle: the candidate mask of every cell, or the mask of its value.
+    """
+    return [BIT[cell.value] if cell.value else cell.mask for cell in puzzle.cells]
 
 
-def solve_sudoku(board):
-    for row in range(9):
-        for col in range(9):
-            if board[row][col] == 0:
-                for num in range(1, 10):
-                    if is_valid(board, row, col, num):
-                        board[row][col] = num
-                        if solve_sudoku(board):
-                            return True
-                        board[row][col] = 0
-                return False
-    return True
+def propagate(masks: list[int], done: int = 0) -> int | None:
+    """
+    Apply naked and hidden singles to `masks` in place until nothing changes.
+
+    Args:
+        masks: The 81 candidate masks.
+        done: Bitboard of the cells whose value was already removed from their peers.
+
+    Returns:
+        int | None: The updated `done` bitboard, or None when the masks contain a contradiction.
+    """
+    stack = [i for i in range(81) if not done >> i & 1 and POPCOUNT[masks[i]] == 1]
+
+    while True:
+        # Naked singles
+        while stack:
+            i = stack.pop()
+            if done >> i & 1:
+                continue
+            done |= 1 << i
+            bit = masks[i]
+            for j in PEERS[i]:
+                mask = masks[j]
+                if mask & bit:
+                    mask ^= bit
+                    if not mask:
+                        return None
+                    masks[j] = mask
+                    if POPCOUNT[mask] == 1:
+                        stack.append(j)
+
+        # Hidden singles
+        for cells in UNITS:
+            once = twice = 0
+            for i in cells:
+                mask = masks[i]
+                twice |= once & mask
+                once |= mask
+            if once != ALL_DIGITS:
+                return None
+            unique = once & ~twice
+            if unique:
+                for i in cells:
+                    mask = masks[i] & unique
+                    if not mask:
+                        continue
+                    if POPCOUNT[mask] > 1:
+                        # Two digits that can only go in this cell
+                        return None
+                    if mask != masks[i]:
+                        masks[i] = mask
+                        stack.append(i)
+
+        if not stack:
+            return done
+
+
+def _branch_cell(masks: list[int]) -> int:
+    """The unsolved cell with the fewest candidates, or -1 when all cells are solved."""
+    best, fewest = -1, 10
+    for i in range(81):
+        count = POPCOUNT[masks[i]]
+        if 1 < count < fewest:
+            best, fewest = i, count
+            if count == 2:
+                break
+    return best
+
+
+def solutions(masks: list[int], done: int = 0) -> Iterator[list[int]]:
+    """
+    Yield every solution reachable from `masks`, as lists of 81 single-digit masks.
+
+    The search branches on the unsolved cell with the fewest candidates.
+    `masks` is modified, pass a copy to keep it.
+    """
+    done = propagate(masks, done)
+    if done is None:
+        return
+
+    best = _branch_cell(masks)
+    if best < 0:
+        yield masks
+        return
+
+    for digit in DIGITS[masks[best]]:
+        child = masks.copy()
+        child[best] = BIT[digit]
+        yield from solutions(child, done)
+
+
+# Number of subtrees per worker process when counting in parallel, see count_solutions()
+SUBTREES_PER_WORKER = 16
+
+# The search backends by name, each a function from candidate masks to an iterator of solutions
+SEARCHES = {
+    "backtrack": solutions,
+    "dlx": dlx.solutions,
+}
+
+
+def search(masks: list[int], backend: str = "backtrack") -> list[int] | None:
+    """
+    Return the first solution reachable from `masks`, or None if there is none.
+    """
+    return next(SEARCHES[backend](masks), None)
+
+
+def split(masks: list[int], count: int) -> list[list[int]]:
+    """
+    Split the search from `masks` into at least `count` independent subtrees, where possible.
+
+    The search tree is expanded one level at a time, branching like `solutions()` does,
+    so the solutions of the subtrees together are exactly the solutions of `masks`.
+    Subtrees that are already solved are kept, and branches with a contradiction are dropped.
+    """
+    subtrees = [masks]
+    while len(subtrees) < count:
+        level = []
+        branched = False
+        for masks in subtrees:
+            if propagate(masks) is None:
+                continue
+            best = _branch_cell(masks)
+            if best < 0:
+                level.append(masks)
+                continue
+            branched = True
+            for digit in DIGITS[masks[best]]:
+                child = masks.copy()
+                child[best] = BIT[digit]
+                level.append(child)
+        subtrees = level
+        if not branched:
+            break
+    return subtrees
+
+
+def _count(masks: list[int], limit: int | None, backend: str) -> int:
+    return sum(1 for _ in islice(SEARCHES[backend](masks), limit))
+
+
+def count_solutions(
+    masks: list[int], limit: int | None = None, backend: str = "backtrack", parallel: int | None = None
+) -> int:
+    """
+    Count the solutions reachable from `masks`, stopping as soon as `limit` are found.
+
+    With `parallel`, the search is split into subtrees (see `split()`) that are counted
+    in a pool of `parallel` processes. Every subtree only sends its 81 masks to a worker.
+
+    Args:
+        masks: The 81 candidate masks. They are modified, pass a copy to keep them.
+        limit: The count to stop at. If None, all solutions are counted.
+        backend: The search backend, see `SEARCHES`.
+        parallel: The number of worker processes. If None, the count runs in this process.
+
+    Returns:
+        int: The number of solutions, at most `limit`.
+    """
+    if not parallel or parallel <= 1:
+        return _count(masks, limit, backend)
+
+    # Imported here, as it takes longer than the rest of the package
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # Many more subtrees than workers, so that uneven subtrees still balance out
+    subtrees = split(masks, parallel * SUBTREES_PER_WORKER)
+    total = 0
+    with ProcessPoolExecutor(max_workers=parallel) as executor:
+        futures = [executor.submit(_count, subtree, limit, backend) for subtree in subtrees]
+        for future in as_completed(futures):
+            total += future.result()
+            if limit is not None and total >= limit:
+                executor.shutdown(wait=False, cancel_futures=True)
+                return limit
+    return total
 
 
 def brute_force(puzzle: "Puzzle") -> bool:
-    grid = copy.deepcopy(puzzle.grid)
-    if solve_sudoku(grid):
-        for row_id, row in enumerate(grid):
-            for col_id, value in enumerate(row):
-                puzzle.cells[row_id * 9 + col_id].set_solution(value)
-        puzzle.strategies_used.add("Brute Force")
-        return True
-    return False
+    """
+    Solve the remaining cells by backtracking, see the module docstring.
+
+    Uses the search backend in `puzzle.search_backend`.
+
+    Returns:
+        bool: Whether the puzzle was solved.
+    """
+    solution = search(puzzle_masks(puzzle), puzzle.search_backend)
+    if solution is None:
+        return False
+    for cell, mask in zip(puzzle.cells, solution):
+        if not cell.is_solved:
+            cell.set_solution(mask=mask)
+    puzzle.strategies_used.add("Brute Force")
+    return True
@@ -0,0 +1,156 @@
+"""
+Exact cover search (Knuth's Algorithm X), as an alternative backend for brute_force.
+
+A sudoku is an exact cover problem with 729 rows, one for every (cell, digit),
+and 324 constraint columns that each have to be covered exactly once:
+
+- 0-80: every cell has a digit
+- 81-161: every row has every digit
+- 162-242: every column has every digit
+- 243-323: every block has every digit
+
+Instead of the linked lists of Dancing Links, the matrix is stored as two tables
+(`ROW_COLUMNS` and `COLUMN_ROWS`) that are built once at import and shared by all searches.
+A search only keeps which rows are still available and how many rows every column has left,
+so covering and uncovering are updates of flat lists.
+
+The search state and results use the same candidate masks as `brute_force`.
+"""
+
+from typing import Iterator
+
+from sudoku_solver_tim.bitmask import BIT, DIGITS, POPCOUNT
+from sudoku_solver_tim.topology import BLOCKS, CELL_BLOCK, CELL_COLUMN, CELL_ROW, COLUMNS, ROWS
+
+N_ROWS = 729
+N_COLUMNS = 324
+
+# Matrix row `cell * 9 + digit - 1` covers these 4 columns
+ROW_COLUMNS = tuple(
+    (
+        i,
+        81 + CELL_ROW[i] * 9 + d,
+        162 + CELL_COLUMN[i] * 9 + d,
+        243 + CELL_BLOCK[i] * 9 + d,
+    )
+    for i in range(81)
+    for d in range(9)
+)
+
+# The 9 matrix rows in every column: the digits of a cell, then the cells of a unit for a digit
+COLUMN_ROWS = tuple(tuple(i * 9 + d for d in range(9)) for i in range(81)) + tuple(
+    tuple(i * 9 + d for i in cells) for cells in ROWS + COLUMNS + BLOCKS for d in range(9)
+)
+
+
+class ExactCover:
+    """
+    The state of one search over the shared matrix.
+
+    Example:
+
+    ```python
+    from sudoku_solver_tim.strategies.master.dlx import ExactCover
+    next(ExactCover(masks).solutions(), None)  # the first solution, as 81 masks
+    ```
+    """
+
+    __slots__ = ("available", "sizes", "open", "chosen", "contradiction")
+
+    def __init__(self, masks: list[int]) -> None:
+        self.available = [True] * N_ROWS
+        self.sizes = [9] * N_COLUMNS
+        self.open = [True] * N_COLUMNS
+        self.chosen = []
+        self.contradiction = False
+
+        # Start from the candidates: remove the rows of digits a cell can no longer hold,
+        # and pick the rows of cells with a single candidate.
+        for i, mask in enumerate(masks):
+            for d in range(9):
+                if not mask >> d & 1:
+                    self._remove(i * 9 + d, [])
+        for i, mask in enumerate(masks):
+            if POPCOUNT[mask] == 1:
+                row = i * 9 + DIGITS[mask][0] - 1
+                if not self.available[row]:
+                    # Ruled out by another single in the same unit
+                    self.contradiction = True
+                    return
+                self._choose(row)
+
+    def _remove(self, row: int, removed: list[int]) -> None:
+        self.available[row] = False
+        removed.append(row)
+        sizes = self.sizes
+        for column in ROW_COLUMNS[row]:
+            sizes[column] -= 1
+
+    def _choose(self, row: int) -> list[int]:
+        """
+        Add `row` to the solution: close its columns and remove all rows that share one.
+        Returns the removed rows, to undo with `_unchoose()`.
+        """
+        removed = []
+        available = self.available
+        for column in ROW_COLUMNS[row]:
+            self.open[column] = False
+            for other in COLUMN_ROWS[column]:
+                if available[other]:
+                    self._remove(other, removed)
+        self.chosen.append(row)
+        return removed
+
+    def _unchoose(self, row: int, removed: list[int]) -> None:
+        self.chosen.pop()
+        available = self.available
+        sizes = self.sizes
+        for other in reversed(removed):
+            available[other] = True
+            for column in ROW_COLUMNS[other]:
+                sizes[column] += 1
+        for column in ROW_COLUMNS[row]:
+            self.open[column] = True
+
+    def _masks(self) -> list[int]:
+        masks = [0] * 81
+        for row in self.chosen:
+            masks[row // 9] = BIT[row % 9 + 1]
+        return masks
+
+    def solutions(self) -> Iterator[list[int]]:
+        """
+        Yield every exact cover, as lists of 81 single-digit masks.
+        """
+        if self.contradiction:
+            return
+        yield from self._search()
+
+    def _search(self) -> Iterator[list[int]]:
+        # Branch on the open column with the fewest rows left
+        best, fewest = -1, 10
+        sizes, open_ = self.sizes, self.open
+        for column in range(N_COLUMNS):
+            if open_[column] and sizes[column] < fewest:
+                best, fewest = column, sizes[column]
+                if fewest <= 1:
+                    break
+        if best < 0:
+            yield self._masks()
+            return
+        if fewest == 0:
+            return
+
+        available = self.available
+        for row in COLUMN_ROWS[best]:
+            if available[row]:
+                removed = self._choose(row)
+                yield from self._search()
+                self._unchoose(row, removed)
+
+
+def solutions(masks: list[int]) -> Iterator[list[int]]:
+    """
+    Yield every solution reachable from the candidate `masks`, see `brute_force.solutions()`.
+    """
+    return ExactCover(masks).solutions()
@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.puzzle import Puzzle
+
+from sudoku_solver_tim.strategies.master.fish import fish
+
+
+def finned_fish(p: "Puzzle", digits: list[int] | None = None) -> bool:
+    """
+    Applies finned fish strategy: finned X-Wings, Swordfish and Jellyfish.
+
+    A finned fish is a fish with extra candidates (fins) in its base lines, all in the same block.
+    The number can only be removed from the cells of the cover lines in that block.
+    See `sudoku_solver_tim.strategies.master.fish`.
+
+    Args:
+        p (Puzzle): The puzzle to solve.
+        digits (list[int] | None): The digits to check. If None, the digits that changed since the last scan are checked.
+
+    Returns:
+        bool: Whether 1 or more cells have been updated.
+    """
+    updates_found = False
+    for size in (2, 3, 4):
+        updates_found |= fish(p, size, "Finned Fish", digits, finned=True)
+    return updates_found
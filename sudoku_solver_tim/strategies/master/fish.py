@@ -0,0 +1,173 @@
+"""
+Shared engine for the fish strategies: X-Wing (size 2), Swordfish (size 3) and Jellyfish (size 4).
+
+For one digit, a fish of size n is a set of n base lines (rows, or columns)
+in which the digit can only go in n cover lines (columns, or rows) between them.
+The n base lines need n placements of the digit, which use up the n cover lines,
+so the digit can be removed from the other cells of the cover lines.
+
+Each base line is a 9-bit mask of the cover lines it can hold the digit in,
+read from `Puzzle.unit_positions`: the positions in a row are columns and vice versa.
+Finding n masks with a union of n bits is the same search as for naked subsets.
+
+A finned fish has extra candidates (fins) in the base lines outside the cover lines,
+all inside one block. Either a fin is the digit, or the fish is a regular fish.
+Both rule out the cells of the cover lines that share that block with the fins.
+
+See:
+
+- https://www.sudokuoftheday.com/techniques/x-wings
+- https://www.sudokuoftheday.com/techniques/swordfish
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.puzzle import Puzzle
+
+from itertools import combinations
+import logging
+
+from sudoku_solver_tim.bitmask import BIT, POPCOUNT
+from sudoku_solver_tim.strategies.advanced.subsets import locked_sets
+from sudoku_solver_tim.topology import COLUMN_UNIT
+
+# A fin block spans 3 cover lines, so a finned base line has at most 3 extra positions
+MAX_FINS = 3
+
+# 9-bit masks of the cover lines in each stack of 3 (a blockrow or blockcolumn seen from the base lines)
+STACK_MASKS = (0b000000111, 0b000111000, 0b111000000)
+
+
+def _cell_index(base: int, cover: int, by_rows: bool) -> int:
+    return base * 9 + cover if by_rows else cover * 9 + base
+
+
+def _base_masks(p: "Puzzle", digit: int, by_rows: bool) -> list[int]:
+    offset = 0 if by_rows else COLUMN_UNIT
+    return [p.unit_positions[offset + line][digit] for line in range(9)]
+
+
+def _eliminate(p: "Puzzle", digit: int, cells: list[int]) -> int:
+    bit = BIT[digit]
+    return sum(1 for i in cells if p.cells[i].remove_markup(mask=bit))
+
+
+def _find_fish(p: "Puzzle", digit: int, size: int, by_rows: bool) -> int:
+    """
+    Find basic fish of `size` for `digit` and eliminate the digit from the rest of the cover lines.
+
+    Returns:
+        int: Number of cells updated
+    """
+    # Lines with a single position are hidden singles, not part of a fish
+    masks = [mask if POPCOUNT[mask] >= 2 else 0 for mask in _base_masks(p, digit, by_rows)]
+    updates = 0
+
+    for bases, covers in locked_sets(masks, size):
+        eliminations = [
+            _cell_index(base, cover, by_rows)
+            for cover in range(9)
+            if covers >> cover & 1
+            for base in range(9)
+            if base not in bases
+        ]
+        found = _eliminate(p, digit, eliminations)
+        if found:
+            logging.debug(f"Fish of size {size} on {digit} in {'rows' if by_rows else 'columns'} {bases}")
+            updates += found
+
+    return updates
+
+
+def _find_finned_fish(p: "Puzzle", digit: int, size: int, by_rows: bool) -> int:
+    """
+    Find finned fish of `size` for `digit` and eliminate the digit from cover cells in the fin block.
+
+    The fins have to be in one block, so in one band of base lines and one stack of 3 cover lines.
+    For each stack, the positions outside of it are cover lines,
+    and only the remaining cover lines are picked from inside the stack.
+
+    Returns:
+        int: Number of cells updated
+    """
+    masks = _base_masks(p, digit, by_rows)
+    lines = [line for line in range(9) if 2 <= POPCOUNT[masks[line]] <= size + MAX_FINS]
+    updates = 0
+
+    for bases in combinations(lines, size):
+        union = 0
+        for base in bases:
+            union |= masks[base]
+        if not size < POPCOUNT[union] <= size + MAX_FINS:
+            # Either a basic fish (see _find_fish) or too many positions
+            continue
+
+        for stack in range(3):
+            stack_mask = STACK_MASKS[stack]
+            core = union & ~stack_mask
+            missing = size - POPCOUNT[core]
+            if missing < 0:
+                continue
+            inside = [c for c in range(stack * 3, stack * 3 + 3) if union >> c & 1]
+            for picked in combinations(inside, missing):
+                covers = core | sum(1 << c for c in picked)
+                fins = union & ~covers
+                if not fins:
+                    continue
+                # The base lines with fins have to be in a single band
+                bands = {base // 3 for base in bases if masks[base] & fins}
+                if len(bands) != 1:
+                    continue
+                (band,) = bands
+                eliminations = [
+                    _cell_index(base, c, by_rows)
+                    for c in picked
+                    for base in range(band * 3, band * 3 + 3)
+                    if base not in bases
+                ]
+                found = _eliminate(p, digit, eliminations)
+                if found:
+                    logging.debug(
+                        f"Finned fish of size {size} on {digit} in {'rows' if by_rows else 'columns'} {bases}"
+                    )
+                    updates += found
+
+    return updates
+
+
+def fish(
+    p: "Puzzle", size: int, label: str, digits: list[int] | None = None, finned: bool = False
+) -> bool:
+    """
+    Apply the fish strategy of `size` in both rows and columns.
+
+    Every digit is repeated until it gives no more eliminations,
+    as an elimination in one direction can complete a fish in the other.
+
+    Args:
+        p: The puzzle to solve.
+        size: The number of base lines: 2 for X-Wing, 3 for Swordfish, 4 for Jellyfish.
+        label: The name added to `p.strategies_used` when cells were updated.
+        digits: The digits to check. If None, the digits that changed since the last scan are checked.
+        finned: Look for finned fish instead of basic fish.
+
+    Returns:
+        bool: Whether 1 or more cells have been updated.
+    """
+    if digits is None:
+        # Only digits whose candidates changed since the last scan can lead to new eliminations
+        digits = p.dirty_digits(f"{label} {size}")
+
+    find = _find_finned_fish if finned else _find_fish
+    updates_found = 0
+    for digit in digits:
+        while updated := find(p, digit, size, True) + find(p, digit, size, False):
+            updates_found += updated
+
+    if updates_found > 0:
+        logging.debug(f"{label} removed {updates_found} candidates")
+        p.strategies_used.add(label)
+        return True
+
+    return False
@@ -0,0 +1,26 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.puzzle import Puzzle
+
+from sudoku_solver_tim.strategies.master.fish import fish
+
+
+def jellyfish(p: "Puzzle", digits: list[int] | None = None) -> bool:
+    """
+    Applies Jellyfish strategy.
+
+    The Swordfish over four lines: four rows (or columns) in which a number
+    can only go in the same four columns (or rows), with two to four positions per line.
+    The number can then be removed from the other cells in those four columns (or rows).
+
+    This is a fish of size 4, see `sudoku_solver_tim.strategies.master.fish`.
+
+    Args:
+        p (Puzzle): The puzzle to solve.
+        digits (list[int] | None): The digits to check. If None, the digits that changed since the last scan are checked.
+
+    Returns:
+        bool: Whether 1 or more cells have been updated.
+    """
+    return fish(p, 4, "Jellyfish", digits)
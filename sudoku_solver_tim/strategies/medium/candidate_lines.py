@@ -5,6 +5,8 @@ if TYPE_CHECKING:
 
 import logging
 
+from sudoku_solver_tim.strategies.medium.intersections import pointing
+
 
 def candidate_lines(p: "Puzzle", digits: list[int] | None = None) -> bool:
     """
@@ -14,60 +16,36 @@ def candidate_lines(p: "Puzzle", digits: list[int] | None = None) -> bool:
 
     - https://www.sudokuoftheday.com/techniques/candidate-lines
 
+    If a digit can only go in one row (or column) of a block,
+    it can be removed from the rest of that row (or column).
+    See `sudoku_solver_tim.strategies.medium.intersections.pointing`.
+
     Returns:
         bool: Whether 1 or more cells have been updated.
     """
 
-    updates_found = _candidate_lines_iteration(p.blocks, digits)
+    if digits is None:
+        # Only digits whose candidates changed since the last scan can lead to new eliminations
+        digits = p.dirty_digits("candidate_lines")
+        if not digits:
+            return False
+
+    updates_found = _candidate_lines_iteration(p, digits)
 
     solutions_found = updates_found > 0
     while updates_found > 0:
         p.strategies_used.add("Candidate Lines")
-        updates_found = _candidate_lines_iteration(p.blocks, digits)
+        updates_found = _candidate_lines_iteration(p, digits)
 
     return solutions_found
 
 
-def _candidate_lines_iteration(blocks, digits: list[int] | None = None):
+def _candidate_lines_iteration(p: "Puzzle", digits: list[int] | None = None):
     updates_found = 0
 
-    for block in blocks:
-        for value in digits or range(1, 10):
-            possible_rows = list(set([c.row for c in block.cells if value in c.markup]))
-            if len(possible_rows) == 1:
-                other_block_cells_in_row = [
-                    c
-                    for c in possible_rows[0].cells
-                    if not c.is_solved and c not in block.cells
-                ]
-                updated_cells = [
-                    c for c in other_block_cells_in_row if c.remove_markup(value)
-                ]
-
-                if len(updated_cells) > 0:
-                    updates_found += 1
-
-            possible_columns = list(
-                set(
-                    [
-                        c.column
-                        for c in block.cells
-                        if not c.is_solved and value in c.markup
-                    ]
-                )
-            )
-            if len(possible_columns) == 1:
-                other_block_cells_in_column = [
-                    c
-                    for c in possible_columns[0].cells
-                    if not c.is_solved and c not in block.cells
-                ]
-                updated_cells = [
-                    c for c in other_block_cells_in_column if c.remove_markup(value)
-                ]
-
-                if len(updated_cells) > 0:
-                    updates_found += 1
+    for block in range(9):
+        for value in range(1, 10) if digits is None else digits:
+            updates_found += pointing(p, block, value)
 
     if updates_found > 0:
         logging.debug(f"Candidate Lines iteration updated {updates_found} cells.")
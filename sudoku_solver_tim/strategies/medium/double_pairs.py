@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sudoku_solver_tim.puzzle import Puzzle
 import logging
-from itertools import combinations
+from sudoku_solver_tim.strategies.medium.intersections import band_line_pairs
+from sudoku_solver_tim.topology import BLOCKCOLUMN_BLOCKS, BLOCKROW_BLOCKS
 
 
 def double_pairs(p: "Puzzle", digits: list[int] | None = None) -> bool:
@@ -24,22 +25,28 @@ def double_pairs(p: "Puzzle", digits: list[int] | None = None) -> bool:
 
     Args:
         p (Puzzle): The puzzle to solve.
-        digits (list[int] | None): The digits to check. If None, all digits will be checked.
+        digits (list[int] | None): The digits to check. If None, the digits that changed since the last scan are checked.
 
     Returns:
         bool: Whether 1 or more cells have been updated.
     """
+    if digits is None:
+        # Only digits whose candidates changed since the last scan can lead to new eliminations
+        digits = p.dirty_digits("double_pairs")
+        if not digits:
+            return False
+
     updates_count = 0
 
     # Process each candidate digit
-    for digit in digits or range(1, 10):
+    for digit in range(1, 10) if digits is None else digits:
         # Check all block rows
-        for block_row in p.blockrows:
-            updates_count += _check_block_group(block_row.blocks, digit, is_row=True)
+        for blocks in BLOCKROW_BLOCKS:
+            updates_count += band_line_pairs(p, blocks, digit, is_row=True, pairs_only=True)
 
         # Check all block columns
-        for block_col in p.blockcolumns:
-            updates_count += _check_block_group(block_col.blocks, digit, is_row=False)
+        for blocks in BLOCKCOLUMN_BLOCKS:
+            updates_count += band_line_pairs(p, blocks, digit, is_row=False, pairs_only=True)
 
     # Update puzzle metadata if changes were made
     if updates_count > 0:
@@ -47,60 +54,3 @@ def double_pairs(p: "Puzzle", digits: list[int] | None = None) -> bool:
         p.strategies_used.add("Double Pairs")
 
     return updates_count > 0
-
-
-def _check_block_group(blocks, digit, is_row=True):
-    """
-    Check a group of 3 blocks (in a row or column) for the double pairs pattern.
-
-    Args:
-        blocks: List of 3 blocks in a row or column
-        digit: The digit to check
-        is_row: Whether the blocks are in a row (True) or column (False)
-
-    Returns:
-        int: Number of candidates removed
-    """
-    updates = 0
-
-    # For each pair of blocks in the group
-    # Get all unique pairs of blocks using combinations
-    for block1, block2 in combinations(blocks, 2):
-        # Get cells that can contain the digit in each block
-        cells1 = [c for c in block1.cells if digit in c.markup]
-        cells2 = [c for c in block2.cells if digit in c.markup]
-
-        # Skip if either block doesn't have the digit as a candidate
-        if not cells1 or not cells2:
-            continue
-
-        # Double pairs will have only two cells in each block that can contain the digit
-        if len(cells1) != 2 or len(cells2) != 2:
-            continue
-
-        # Find the lines (rows or columns) the digit appears in for each block
-        if is_row:
-            lines1 = {c.row.id for c in cells1}
-            lines2 = {c.row.id for c in cells2}
-        else:
-            lines1 = {c.column.id for c in cells1}
-            lines2 = {c.column.id for c in cells2}
-
-        # If both blocks restrict the digit to the same two lines
-        # And their are two lines (rows or columns)
-        if lines1 == lines2 and len(lines1) == 2:
-            # if digit == 2 and not is_row:
-            #     import pdb; pdb.set_trace()
-            # Remove the digit from cells in the third block that are in those lines
-            third_block = [b for b in blocks if b != block1 and b != block2][0]
-            cells3 = [c for c in third_block.cells if digit in c.markup]
-            for cell in cells3:
-                line_id = cell.row.id if is_row else cell.column.id
-                if line_id in lines1:
-                    if cell.remove_markup(digit):
-                        logging.debug(
-                            f"Double pairs: Removed {digit} from cell at r{cell.row_id + 1}c{cell.col_id + 1}"
-                        )
-                        updates += 1
-
-    return updates
@@ -0,0 +1,109 @@
+"""
+Shared engine for the intersection strategies: candidate lines, double pairs and multiple lines.
+
+All three look at how the candidates of a digit are spread over the 54 intersections
+of a block with a row or column (3 cells each, see `topology.INTERSECTIONS`).
+The masks below are computed once, and combined with `Puzzle.bitboards` to find:
+
+- pointing (candidate lines): the digit only fits in one line of a block,
+  so it can be removed from the rest of that line.
+- double pairs / multiple lines: two blocks of a band (blockrow or blockcolumn)
+  restrict the digit to the same two lines, so it can be removed from those lines in the third block.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sudoku_solver_tim.puzzle import Puzzle
+
+from itertools import combinations
+
+from sudoku_solver_tim.bitmask import BIT, BLOCK_MASKS, POPCOUNT, UNIT_MASKS, bit_indices
+from sudoku_solver_tim.topology import INTERSECTIONS
+
+# 81-bit masks of the 3 cells of each intersection, in the order of topology.INTERSECTIONS
+INTERSECTION_MASKS = tuple(sum(1 << i for i in cells) for _, _, cells in INTERSECTIONS)
+
+# The rest of the line outside of each intersection
+LINE_REST_MASKS = tuple(
+    UNIT_MASKS[line] & ~BLOCK_MASKS[block] for block, line, _ in INTERSECTIONS
+)
+
+# For each block, the intersection masks with its 3 rows and with its 3 columns (top to bottom, left to right)
+BLOCK_ROW_MASKS = tuple(
+    tuple(INTERSECTION_MASKS[i] for i in range(block * 6, block * 6 + 3)) for block in range(9)
+)
+BLOCK_COLUMN_MASKS = tuple(
+    tuple(INTERSECTION_MASKS[i] for i in range(block * 6 + 3, block * 6 + 6)) for block in range(9)
+)
+
+# Indices into INTERSECTIONS per block
+BLOCK_INTERSECTIONS = tuple(tuple(range(block * 6, block * 6 + 6)) for block in range(9))
+
+
+def _eliminate(p: "Puzzle", digit: int, board: int) -> int:
+    bit = BIT[digit]
+    cells = p.cells
+    return sum(1 for i in bit_indices(board) if cells[i].remove_markup(mask=bit))
+
+
+def pointing(p: "Puzzle", block: int, digit: int) -> int:
+    """
+    Remove `digit` from the rest of a row or column when it only fits in that line within `block`.
+
+    Returns:
+        int: The number of intersections (0-2) that led to eliminations.
+    """
+    found = 0
+    for i in BLOCK_INTERSECTIONS[block]:
+        board = p.bitboards[digit] & BLOCK_MASKS[block]
+        if board and not board & ~INTERSECTION_MASKS[i]:
+            found += _eliminate(p, digit, p.bitboards[digit] & LINE_REST_MASKS[i]) > 0
+    return found
+
+
+def _line_signature(board: int, line_masks: tuple[int, int, int]) -> int:
+    """3-bit mask of the lines of a block that hold candidates in `board`."""
+    return (
+        (board & line_masks[0] != 0)
+        | (board & line_masks[1] != 0) << 1
+        | (board & line_masks[2] != 0) << 2
+    )
+
+
+def band_line_pairs(p: "Puzzle", blocks: tuple[int, ...], digit: int, is_row: bool, pairs_only: bool) -> int:
+    """
+    Find two blocks of a band that restrict `digit` to the same two lines,
+    and remove the digit from those lines in the third block.
+
+    Args:
+        blocks: The 3 blocks of a blockrow (`is_row`) or blockcolumn.
+        pairs_only: Only use blocks with exactly two candidate cells (double pairs),
+            instead of any number (multiple lines).
+
+    Returns:
+        int: Number of candidates removed
+    """
+    updates = 0
+    block_lines = BLOCK_ROW_MASKS if is_row else BLOCK_COLUMN_MASKS
+
+    for block1, block2 in combinations(blocks, 2):
+        board1 = p.bitboards[digit] & BLOCK_MASKS[block1]
+        board2 = p.bitboards[digit] & BLOCK_MASKS[block2]
+        if not board1 or not board2:
+            continue
+        if pairs_only and (board1.bit_count() != 2 or board2.bit_count() != 2):
+            continue
+
+        lines = _line_signature(board1, block_lines[block1])
+        if POPCOUNT[lines] != 2 or lines != _line_signature(board2, block_lines[block2]):
+            continue
+
+        (block3,) = (b for b in blocks if b != block1 and b != block2)
+        board3 = 0
+        for k in range(3):
+            if lines >> k & 1:
+                board3 |= block_lines[block3][k]
+        updates += _eliminate(p, digit, p.bitboards[digit] & board3)
+
+    return updates
@@ -0,0 +1,265 @@
+"""
+Solve a file of puzzles as a stream, with constant memory.
+
+The input has one puzzle per line, in the 81 character format of `Puzzle.from_string()`.
+Blank lines and lines starting with # are skipped, and gzip files are read transparently.
+Lines are read lazily, and at most `read_ahead` puzzles are read before their results are yielded,
+so memory use doesn't depend on the size of the input.
+
+Example:
+
+```python
+from sudoku_solver_tim.stream import iter_solve, write_ndjson
+
+with open("solutions.ndjson", "w") as out:
+    write_ndjson(iter_solve("puzzles.txt.gz", workers=8), out)
+```
+"""
+
+from collections import deque
+from itertools import islice
+from typing import IO, Callable, Iterable, Iterator, List
+import csv
+import gzip
+import io
+import json
+import os
+import queue
+import threading
+
+from sudoku_solver_tim.batch import SolveResult, _solve_chunk
+
+# The magic number at the start of every gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
+
+FIELDS = ["index", "puzzle", "solution", "solved", "strategies_used", "error"]
+
+
+def _decode(f: IO[bytes]) -> io.TextIOWrapper:
+    # Check for gzip without consuming the start of the stream
+    stream = gzip.GzipFile(fileobj=f) if f.peek(2)[:2] == GZIP_MAGIC else f
+    # Skip a byte order mark, and replace undecodable bytes,
+    # so that a line with a stray byte gives an error result instead of stopping the stream
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace")
+
+
+def _text_lines(source: str | os.PathLike | IO) -> Iterator[str]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from _decode(f)
+        return
+
+    if isinstance(source, io.TextIOBase):
+        yield from source
+        return
+
+    # A binary file object of the caller
+    wrapped = not hasattr(source, "peek")
+    buffered = io.BufferedReader(source) if wrapped else source
+    text = _decode(buffered)
+    try:
+        yield from text
+    finally:
+        # Don't close the file of the caller when the wrappers are garbage collected
+        if not text.closed:
+            text.detach()
+            if wrapped:
+                buffered.detach()
+
+
+def read_puzzles(source: str | os.PathLike | IO) -> Iterator[str]:
+    """
+    Yield the puzzle strings in a file, one line at a time.
+
+    Args:
+        source: A path, or a text or binary file object. Gzip compressed input is detected from its content.
+    """
+    for line in _text_lines(source):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def iter_solve(
+    source: str | os.PathLike | IO | Iterable[str],
+    workers: int = 1,
+    chunksize: int = 64,
+    read_ahead: int = 1024,
+    strategies: List[Callable] | None = None,
+) -> Iterator[SolveResult]:
+    """
+    Solve the puzzles in a file one by one, and yield their results in input order.
+
+    Args:
+        source: A path or file object (see `read_puzzles()`), or an iterable of puzzle strings.
+            With more than one worker, it is read in a background thread.
+        workers: The number of worker processes. With 1, the puzzles are solved in this process.
+        chunksize: The number of puzzles sent to a worker at a time, when `workers` > 1.
+        read_ahead: The maximum number of puzzles read before their results are yielded, when `workers` > 1.
+            It needs to be at least `chunksize`, and `chunksize * workers` to keep every worker busy.
+            Results are yielded as soon as they are ready: a worker that is idle gets the lines
+            that have arrived so far, instead of waiting for a full chunk.
+        strategies: The strategies to use, see `Puzzle.solve()`.
+
+    Returns:
+        Iterator[SolveResult]: The result of every puzzle, see `sudoku_solver_tim.batch.SolveResult`.
+
+    Raises:
+        ValueError: When `chunksize` is less than 1, or `read_ahead` is less than `chunksize` with more than one worker.
+    """
+    # Checked here, as the generator below wouldn't raise until its first result is asked for
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    if workers > 1 and read_ahead < chunksize:
+        raise ValueError(f"read_ahead ({read_ahead}) must be at least chunksize ({chunksize}) with more than one worker")
+    return _iter_solve(source, workers, chunksize, read_ahead, strategies)
+
+
+def _iter_solve(
+    source: str | os.PathLike | IO | Iterable[str],
+    workers: int,
+    chunksize: int,
+    read_ahead: int,
+    strategies: List[Callable] | None,
+) -> Iterator[SolveResult]:
+    if isinstance(source, (str, os.PathLike, io.IOBase)):
+        source = read_puzzles(source)
+    # A line that is not a puzzle gives a result with an error, instead of stopping the stream
+    payloads = (puzzle.replace("0", ".").encode("ascii", "replace") for puzzle in source)
+
+    def results(start: int, chunk: List[bytes], chunk_results: List[tuple]) -> Iterator[SolveResult]:
+        for index, payload, (solution, solved, strategies_used, error) in zip(
+            range(start, start + len(chunk)), chunk, chunk_results
+        ):
+            yield SolveResult(
+                index, payload.decode("ascii"), solution.decode("ascii"), solved, frozenset(strategies_used), error
+            )
+
+    if workers <= 1:
+        # One at a time, so that every result is ready as soon as its line is read
+        for index, payload in enumerate(payloads):
+            yield from results(index, [payload], _solve_chunk([payload], strategies))
+        return
+
+    # The reader thread reads ahead, so that results are yielded as soon as they are ready,
+    # also while the next lines of a slow source are still on their way.
+    # It takes a slot of the read-ahead buffer for every line, which is given back once its result is yielded.
+    events = queue.SimpleQueue()
+    slots = threading.Semaphore(read_ahead)
+    stop = threading.Event()
+    # Chunks in flight, oldest first. Yielding from the oldest keeps the results in order.
+    pending = deque()
+    start = 0
+
+    # The first line is read here: the worker processes are started with the first chunk,
+    # and forking is only safe before the reader thread runs.
+    slots.acquire()
+    chunk = list(islice(payloads, 1))
+    if not chunk:
+        return
+    reading = True
+    reader = threading.Thread(target=_read_ahead, args=(payloads, events, slots, stop), daemon=True)
+
+    # Imported here, as it takes longer than the rest of the package
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                # Send a full chunk, or what there is when no more lines are waiting and a worker is idle
+                if chunk and (len(chunk) >= chunksize or not reading or (events.empty() and len(pending) < workers)):
+                    future = executor.submit(_solve_chunk, chunk, strategies)
+                    future.add_done_callback(lambda _: events.put(_DONE))
+                    pending.append((start, chunk, future))
+                    start += len(chunk)
+                    chunk = []
+                    if start == 1:
+                        # The workers run now, see above
+                        reader.start()
+
+                while pending and pending[0][2].done():
+                    first, first_chunk, future = pending.popleft()
+                    yield from results(first, first_chunk, future.result())
+                    for _ in first_chunk:
+                        slots.release()
+
+                if not (reading or chunk or pending):
+                    return
+
+                # Wait for a line, the end of the input, or a finished chunk
+                event = events.get()
+                if event is _END:
+                    reading = False
+                elif isinstance(event, BaseException):
+                    raise event
+                elif event is not _DONE:
+                    chunk.append(event)
+        finally:
+            # Stop the reader, unless it is waiting for a line of a slow source (it is a daemon thread),
+            # and drop the chunks that were not started when the results are no longer wanted
+            stop.set()
+            slots.release()
+            if not reading:
+                reader.join()
+            executor.shutdown(cancel_futures=True)
+
+
+# Events of the reader thread and the worker processes, see _iter_solve()
+_END = object()
+_DONE = object()
+
+
+def _read_ahead(payloads: Iterator[bytes], events: queue.SimpleQueue, slots: threading.Semaphore, stop: threading.Event):
+    """
+    Put the payloads on `events` as they are read, taking a slot of the read-ahead buffer for each,
+    followed by _END or the exception that stopped the reading.
+    """
+    try:
+        while True:
+            slots.acquire()
+            if stop.is_set():
+                return
+            payload = next(payloads, _END)
+            events.put(payload)
+            if payload is _END:
+                return
+    except BaseException as e:
+        events.put(e)
+
+
+def _record(result: SolveResult) -> dict:
+    record = result._asdict()
+    record["strategies_used"] = sorted(result.strategies_used)
+    return record
+
+
+def write_ndjson(results: Iterable[SolveResult], f: IO[str]) -> int:
+    """
+    Write every result as a line of JSON, with the fields of `SolveResult`.
+
+    Returns:
+        int: The number of results written.
+    """
+    n = 0
+    for result in results:
+        f.write(json.dumps(_record(result)) + "\n")
+        n += 1
+    return n
+
+
+def write_csv(results: Iterable[SolveResult], f: IO[str]) -> int:
+    """
+    Write the results as CSV with a header, with the strategies used separated by ;.
+
+    Returns:
+        int: The number of results written.
+    """
+    writer = csv.DictWriter(f, fieldnames=FIELDS)
+    writer.writeheader()
+    n = 0
+    for result in results:
+        record = _record(result)
+        record["strategies_used"] = ";".join(record["strategies_used"])
+        writer.writerow(record)
+        n += 1
+    return n
@@ -0,0 +1,72 @@
+"""
+Board topology shared by all 9x9 puzzles.
+
+Cells are numbered 0-80 in row-major order (`row * 9 + col`),
+which is also their position in `Puzzle.cells` and their bit in `Puzzle.bitboards`.
+Units are numbered 0-26: rows 0-8, columns 9-17 and blocks 18-26.
+
+All tables are computed once at import and are immutable tuples.
+
+Example:
+
+```python
+from sudoku_solver_tim.topology import PEERS, UNITS
+
+PEERS[0]  # the 20 cells that share a row, column or block with the top left cell
+UNITS[18]  # the 9 cells of the top left block
+```
+"""
+
+# Unit membership
+ROWS = tuple(tuple(row * 9 + col for col in range(9)) for row in range(9))
+COLUMNS = tuple(tuple(row * 9 + col for row in range(9)) for col in range(9))
+BLOCKS = tuple(
+    tuple((block // 3 * 3 + i // 3) * 9 + block % 3 * 3 + i % 3 for i in range(9))
+    for block in range(9)
+)
+UNITS = ROWS + COLUMNS + BLOCKS
+
+# Offsets of the columns and blocks in UNITS
+COLUMN_UNIT = 9
+BLOCK_UNIT = 18
+
+# For each cell: the id of its row, column and block
+CELL_ROW = tuple(i // 9 for i in range(81))
+CELL_COLUMN = tuple(i % 9 for i in range(81))
+CELL_BLOCK = tuple(i // 27 * 3 + i % 9 // 3 for i in range(81))
+
+# For each cell: the 3 units it is part of (row, column, block)
+CELL_UNITS = tuple(
+    (CELL_ROW[i], COLUMN_UNIT + CELL_COLUMN[i], BLOCK_UNIT + CELL_BLOCK[i])
+    for i in range(81)
+)
+
+# For each cell: its position (0-8) within each of its 3 units, in the order of CELL_UNITS
+CELL_POSITIONS = tuple(
+    tuple(UNITS[u].index(i) for u in CELL_UNITS[i])
+    for i in range(81)
+)
+
+# For each cell: the 20 other cells that share a unit with it
+PEERS = tuple(
+    tuple(sorted(set().union(*(UNITS[u] for u in CELL_UNITS[i])) - {i}))
+    for i in range(81)
+)
+
+# Blocks in each blockrow (horizontal band) and blockcolumn (vertical stack)
+BLOCKROW_BLOCKS = tuple(tuple(band * 3 + i for i in range(3)) for band in range(3))
+BLOCKCOLUMN_BLOCKS = tuple(tuple(stack + i * 3 for i in range(3)) for stack in range(3))
+BLOCKROW_CELLS = tuple(tuple(sorted(sum((BLOCKS[b] for b in blocks), ()))) for blocks in BLOCKROW_BLOCKS)
+BLOCKCOLUMN_CELLS = tuple(tuple(sorted(sum((BLOCKS[b] for b in blocks), ()))) for blocks in BLOCKCOLUMN_BLOCKS)
+
+# Rows and columns crossing each block
+BLOCK_ROWS = tuple(tuple(block // 3 * 3 + i for i in range(3)) for block in range(9))
+BLOCK_COLUMNS = tuple(tuple(block % 3 * 3 + i for i in range(3)) for block in range(9))
+
+# The 54 block x line intersections as (block, line unit, cells).
+# The line unit indexes UNITS, the cells are the 3 cells the block and line share.
+INTERSECTIONS = tuple(
+    (block, line, tuple(sorted(set(BLOCKS[block]) & set(UNITS[line]))))
+    for block in range(9)
+    for line in BLOCK_ROWS[block] + tuple(COLUMN_UNIT + c for c in BLOCK_COLUMNS[block])
+)
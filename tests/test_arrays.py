@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sudoku_solver_tim.arrays import (  # noqa: E402
+    CONTRADICTION,
+    SOLVED,
+    STALLED,
+    STATUS_INVALID,
+    STATUS_UNSOLVED,
+    candidates,
+    propagate_singles,
+    solve_array,
+)
+from sudoku_solver_tim.puzzle import Puzzle  # noqa: E402
+from sudoku_solver_tim.strategies import single_candidates, single_position  # noqa: E402
+
+GRIDS = (Path(__file__).parent / "fixtures" / "grids.txt").read_text().split()[:10]
+
+
+def _to_array(strings):
+    return np.array([[int(c) if c != "." else 0 for c in s] for s in strings], dtype=np.uint8)
+
+
+def test_solve_array():
+    puzzles = _to_array(GRIDS)
+    out = solve_array(puzzles)
+    assert out.shape == (len(GRIDS), 82)
+    assert out.dtype == np.uint8
+    for string, row in zip(GRIDS, out):
+        p = Puzzle.from_string(string)
+        p.solve()
+        assert row[:81].tolist() == [c.value for c in p.cells]
+        assert 1 <= row[81] <= 4
+
+
+def test_preallocated_output():
+    puzzles = _to_array(GRIDS[:3])
+    out = np.zeros((3, 82), dtype=np.uint8)
+    assert solve_array(puzzles, out) is out
+    assert (out[:, :81] > 0).all()
+
+    with pytest.raises(ValueError):
+        solve_array(puzzles, np.zeros((3, 81), dtype=np.uint8))
+
+
+def test_buffer_input():
+    puzzles = _to_array(GRIDS[:2])
+    out = solve_array(puzzles.tobytes())
+    assert (out == solve_array(puzzles)).all()
+    assert (solve_array(memoryview(puzzles)) == out).all()
+
+
+def test_status_codes():
+    invalid = [1, 1] + [0] * 79
+    puzzles = np.vstack([_to_array(GRIDS[:1]), np.array([invalid], dtype=np.uint8)])
+    out = solve_array(puzzles, strategies=[single_candidates])
+    assert out[0, 81] == STATUS_UNSOLVED
+    assert out[1, 81] == STATUS_INVALID
+    assert out[1, :81].tolist() == invalid
+
+
+def test_difficulty_codes():
+    solution = Puzzle.from_string(GRIDS[0])
+    solution.solve()
+    values = [c.value for c in solution.cells]
+    # A single empty cell only needs the easiest strategy
+    out = solve_array(np.array([[0] + values[1:], values], dtype=np.uint8))
+    assert out[:, 81].tolist() == [1, 1]
+    assert out[0, 0] == values[0]
+
+
+def test_invalid_values():
+    with pytest.raises(ValueError):
+        solve_array(np.full((1, 81), 10, dtype=np.uint8))
+
+
+def test_candidates():
+    tensor = candidates(_to_array(GRIDS[:1]))
+    assert tensor.shape == (1, 81, 9)
+    for cell, string in zip(tensor[0], GRIDS[0]):
+        assert cell.sum() == (9 if string == "." else 1)
+
+
+def test_propagate_singles():
+    puzzles = _to_array(GRIDS)
+    tensor = candidates(puzzles)
+    status = propagate_singles(tensor)
+    assert set(status.tolist()) <= {SOLVED, STALLED}
+    for string, cells, s in zip(GRIDS, tensor, status):
+        p = Puzzle.from_string(string)
+        p.solve(strategies=[single_candidates, single_position])
+        assert (s == SOLVED) == p.is_solved()
+        # Singles end in the same state, whatever the order they are applied in
+        for cell, c in zip(cells, p.cells):
+            assert [d + 1 for d in range(9) if cell[d]] == ([c.value] if c.value else sorted(c.markup))
+
+
+def test_propagate_singles_contradiction():
+    # The last two cells of the first row can only hold a 9: the 8s in their columns rule out the other digit
+    values = np.zeros((1, 81), dtype=np.uint8)
+    values[0, :7] = [1, 2, 3, 4, 5, 6, 7]
+    values[0, 3 * 9 + 7] = values[0, 6 * 9 + 8] = 8
+    tensor = candidates(values)
+    assert propagate_singles(tensor).tolist() == [CONTRADICTION]
+
+
+def test_numpy_engine():
+    invalid = [1, 1] + [0] * 79
+    puzzles = np.vstack([_to_array(GRIDS), np.array([invalid], dtype=np.uint8)])
+    out = solve_array(puzzles, engine="numpy")
+    assert (out == solve_array(puzzles)).all()
+    assert (solve_array(puzzles, strategies=[single_candidates], engine="numpy") == solve_array(
+        puzzles, strategies=[single_candidates]
+    )).all()
+
+    with pytest.raises(ValueError):
+        solve_array(puzzles, engine="gpu")
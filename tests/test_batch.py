@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from sudoku_solver_tim import Puzzle, solve_many
+from sudoku_solver_tim.batch import to_payload
+from sudoku_solver_tim.strategies import single_candidates
+
+GRIDS = [line.strip() for line in (Path(__file__).parent / "fixtures" / "grids.txt").read_text().splitlines()][:40]
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+
+
+def _solve(string):
+    p = Puzzle.from_string(string)
+    solved = p.solve()
+    return p.to_string(), solved, p.strategies_used
+
+
+def test_to_payload():
+    assert to_payload(STRING) == STRING.encode()
+    assert to_payload(STRING.replace(".", "0")) == STRING.encode()
+    assert to_payload(Puzzle.from_string(STRING).grid) == STRING.encode()
+    # Malformed puzzles are left to the workers, which return an error result for them
+    assert to_payload(STRING[:80]) == STRING[:80].encode()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many(workers):
+    results = list(solve_many(GRIDS, workers=workers, chunksize=3))
+    assert [r.index for r in results] == list(range(len(GRIDS)))
+    for result, string in zip(results, GRIDS):
+        assert result.puzzle == string
+        assert (result.solution, result.solved, result.strategies_used) == _solve(string)
+        assert result.error is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many_unordered(workers):
+    results = list(solve_many(GRIDS, workers=workers, chunksize=3, ordered=False))
+    assert sorted(r.index for r in results) == list(range(len(GRIDS)))
+    assert all(r.puzzle == GRIDS[r.index] for r in results)
+
+
+def test_duplicates():
+    grids = [STRING, GRIDS[0], STRING, STRING]
+    results = list(solve_many(grids, workers=1, chunksize=1))
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].solution == results[2].solution == results[3].solution
+    assert results[1].puzzle == GRIDS[0]
+
+
+def test_strategies_and_errors():
+    invalid = "11" + "." * 79
+    results = list(solve_many([STRING, invalid], workers=1, strategies=[single_candidates]))
+    assert not results[0].solved
+    assert results[0].strategies_used <= {"Single Candidate"}
+    assert not results[1].solved
+    assert results[1].error
+    assert results[1].solution == invalid
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_malformed_grid_does_not_fail_the_batch(workers):
+    grids = [STRING, "123", GRIDS[0], [[0] * 9] * 8]
+    results = list(solve_many(grids, workers=workers, chunksize=1))
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].solved and results[0].error is None
+    assert results[2].solved and results[2].error is None
+    assert results[1].error == "A puzzle needs 81 cells, got 3"
+    assert results[1].solution == results[1].puzzle == "123"
+    assert not results[3].solved
+    assert results[3].error == "A puzzle needs 81 cells, got 72"
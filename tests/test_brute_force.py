@@ -68,3 +68,22 @@ def test_brute_force(strategies, puzzle, url):
     p.solve(strategies=[brute_force])
     assert "Brute Force" in p.strategies_used
     assert p.is_solved()
+
+
+def test_brute_force_contradiction():
+    # r1c8 and r1c9 can both only be a 9
+    string = "1234567.." + "." * 18 + ".......8." + "." * 18 + "........8" + "." * 18
+    p = Puzzle.from_string(string)
+    assert p.cells[7].markup == {9} and p.cells[8].markup == {9}
+    assert not brute_force(p)
+    assert p.unsolved == string.count(".")
+    assert "Brute Force" not in p.strategies_used
+
+
+def test_brute_force_row_major_worst_case():
+    # Designed against row-major backtracking: the first row is 987654321
+    string = "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9"
+    p = Puzzle.from_string(string)
+    assert brute_force(p)
+    p.validate()
+    assert "".join(str(c.value) for c in p.cells[:9]) == "987654321"
@@ -0,0 +1,125 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from sudoku_solver_tim import Puzzle, SolveCache
+from sudoku_solver_tim.cache import cache_key
+from sudoku_solver_tim.strategies import STRATEGIES, brute_force, single_candidates, single_position
+
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+SOLUTION = "254893167698715324713642589547381692926457831381926745169278453872534916435169278"
+
+
+def _grids(n):
+    # Different puzzles: the solution with one cell left out
+    return [SOLUTION[:i] + "." + SOLUTION[i + 1:] for i in range(n)]
+
+
+def test_steps():
+    p = Puzzle.from_string(STRING)
+    p.solve()
+    assert p.steps
+    assert p.steps[0] == "single_candidates"
+    assert "brute_force" in p.steps
+
+
+def test_hit_and_miss():
+    cache = SolveCache()
+    p = Puzzle.from_string(STRING)
+    assert p.solve(cache=cache)
+    assert cache.cache_info() == (0, 1, 0, 1024, 1)
+
+    q = Puzzle.from_string(STRING)
+    assert q.solve(cache=cache)
+    assert cache.cache_info().hits == 1
+    assert q.to_string() == SOLUTION
+    assert q.strategies_used == p.strategies_used
+    assert q.steps == p.steps
+
+
+def test_key_includes_strategies():
+    assert cache_key(STRING) != cache_key(STRING, [single_candidates])
+    # The order of the strategies doesn't matter
+    assert cache_key(STRING, [single_position, single_candidates]) == cache_key(
+        STRING, [single_candidates, single_position]
+    )
+
+    cache = SolveCache()
+    assert not Puzzle.from_string(STRING).solve(strategies=[single_candidates], cache=cache)
+    assert Puzzle.from_string(STRING).solve(cache=cache)
+    assert cache.cache_info().misses == 2
+
+    p = Puzzle.from_string(STRING)
+    assert not p.solve(strategies=[single_candidates], cache=cache)
+    assert cache.cache_info().hits == 1
+    assert "." in p.to_string()
+
+
+def test_key_includes_search():
+    assert cache_key(STRING) == cache_key(STRING, STRATEGIES)
+    assert cache_key(STRING, search="backtrack") != cache_key(STRING, search="dlx")
+
+    # A grid with many solutions: each backend finds its own
+    cache = SolveCache()
+    empty = "." * 81
+    solutions = {}
+    for search in ["backtrack", "dlx"]:
+        expected = Puzzle.from_string(empty)
+        expected.solve(strategies=[brute_force], search=search)
+        p = Puzzle.from_string(empty)
+        assert p.solve(strategies=[brute_force], search=search, cache=cache)
+        assert p.to_string() == expected.to_string()
+        solutions[search] = p.to_string()
+    assert solutions["backtrack"] != solutions["dlx"]
+    assert cache.cache_info().misses == 2
+
+    # Solving with all strategies by default or by name is the same entry
+    Puzzle.from_string(STRING).solve(cache=cache)
+    Puzzle.from_string(STRING).solve(strategies=STRATEGIES, cache=cache)
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().currsize == 3
+
+
+def test_lru_eviction():
+    cache = SolveCache(maxsize=3)
+    grids = _grids(4)
+    for string in grids:
+        Puzzle.from_string(string).solve(cache=cache)
+    info = cache.cache_info()
+    assert info.evictions == 1
+    assert info.currsize == 3
+
+    # The first grid was evicted, the last one is still there
+    Puzzle.from_string(grids[3]).solve(cache=cache)
+    Puzzle.from_string(grids[0]).solve(cache=cache)
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 5
+
+
+def test_sqlite_persists(tmp_path):
+    path = tmp_path / "solves.sqlite"
+    with SolveCache(path) as cache:
+        Puzzle.from_string(STRING).solve(strategies=[single_candidates, brute_force], cache=cache)
+
+    with SolveCache(path) as cache:
+        p = Puzzle.from_string(STRING)
+        assert p.solve(strategies=[single_candidates, brute_force], cache=cache)
+        assert cache.cache_info().hits == 1
+        assert p.to_string() == SOLUTION
+        assert p.strategies_used == {"Single Candidate", "Brute Force"}
+
+
+def _solve_all(path, grids):
+    with SolveCache(path) as cache:
+        for string in grids:
+            Puzzle.from_string(string).solve(cache=cache)
+        return cache.cache_info()
+
+
+def test_concurrent_processes(tmp_path):
+    path = tmp_path / "solves.sqlite"
+    grids = _grids(20)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        infos = list(executor.map(_solve_all, [path] * 4, [grids] * 4))
+    assert all(info.hits + info.misses == len(grids) for info in infos)
+
+    info = _solve_all(path, grids)
+    assert info.hits == len(grids)
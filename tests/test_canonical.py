@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from sudoku_solver_tim.canonical import COLUMN_ORDERS, Transform, canonical_form
+from sudoku_solver_tim.puzzle import Puzzle
+
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+
+
+def random_transform(rng: random.Random) -> Transform:
+    bands = rng.sample(range(3), 3)
+    rows = tuple(band * 3 + row for band in bands for row in rng.sample(range(3), 3))
+    digits = (0,) + tuple(rng.sample(range(1, 10), 9))
+    return Transform(rng.random() < 0.5, rows, rng.choice(COLUMN_ORDERS), digits)
+
+
+def test_column_orders():
+    assert len(COLUMN_ORDERS) == 6**4
+    assert len(set(COLUMN_ORDERS)) == 6**4
+
+
+def test_to_string():
+    assert Puzzle.from_string(STRING).to_string() == STRING
+
+
+def test_transform_apply_and_revert():
+    rng = random.Random(0)
+    grid = Puzzle.from_string(STRING).grid
+    for _ in range(10):
+        transform = random_transform(rng)
+        assert transform.apply(grid) != grid
+        assert transform.revert(transform.apply(grid)) == grid
+
+
+def test_canonical_form():
+    p = Puzzle.from_string(STRING)
+    string, transform = p.canonical_form()
+    assert len(string) == 81
+    assert string.count(".") == STRING.count(".")
+    # The givens come first, and are labelled in order of appearance
+    assert string.startswith("12")
+    assert transform.apply(p.grid) == Puzzle.from_string(string).grid
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_canonical_form_is_invariant(seed):
+    rng = random.Random(seed)
+    p = Puzzle.from_string(STRING)
+    string, _ = p.canonical_form()
+    other = Puzzle(random_transform(rng).apply(p.grid))
+    assert other.canonical_form()[0] == string
+
+
+def test_map_solution_back():
+    p = Puzzle.from_string(STRING)
+    string, transform = p.canonical_form()
+    canonical = Puzzle.from_string(string)
+    assert canonical.solve()
+
+    p.solve()
+    assert transform.revert(canonical.grid) == p.grid
+
+
+def test_canonical_form_of_empty_grid():
+    string, transform = canonical_form([0] * 81)
+    assert string == "." * 81
+    assert transform.revert(transform.apply([[0] * 9] * 9)) == [[0] * 9] * 9
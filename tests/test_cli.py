@@ -0,0 +1,90 @@
+import csv
+import gzip
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from sudoku_solver_tim.cli import main
+
+GRIDS = (Path(__file__).parent / "fixtures" / "grids.txt").read_text().split()[:5]
+
+
+@pytest.fixture
+def puzzles(tmp_path):
+    path = tmp_path / "puzzles.txt.gz"
+    path.write_bytes(gzip.compress("\n".join(GRIDS).encode()))
+    return path
+
+
+def test_ndjson(puzzles, capsys):
+    assert main([str(puzzles)]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["puzzle"] for r in records] == GRIDS
+    assert all(r["solved"] for r in records)
+
+
+def test_csv_output_file(puzzles, tmp_path):
+    output = tmp_path / "solutions.csv"
+    assert main([str(puzzles), "--format", "csv", "-o", str(output), "--workers", "2", "--chunksize", "2"]) == 0
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["puzzle"] for row in rows] == GRIDS
+
+
+def test_strategies(puzzles, capsys):
+    assert main([str(puzzles), "--strategies", "single_candidates,single_position"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert all(set(r["strategies_used"]) <= {"Single Candidate", "Single Position"} for r in records)
+
+
+def test_unknown_strategy(capsys):
+    with pytest.raises(SystemExit):
+        main(["--strategies", "single_candidates,guessing"])
+    assert "guessing" in capsys.readouterr().err
+
+
+def test_chunksize_above_read_ahead(puzzles, capsys):
+    with pytest.raises(SystemExit):
+        main([str(puzzles), "--workers", "2", "--chunksize", "2048"])
+    assert "read_ahead" in capsys.readouterr().err
+
+
+def test_fast(puzzles, capsys):
+    assert main([str(puzzles), "--fast"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert all(r["solved"] and r["strategies_used"] == ["Brute Force"] for r in records)
+
+
+def test_benchmark(puzzles, capsys):
+    assert main([str(puzzles), "--benchmark"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["puzzles"] == summary["solved"] == len(GRIDS)
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_stdin_streaming(workers):
+    # Results come out one at a time while stdin is still open
+    process = subprocess.Popen(
+        [sys.executable, "-m", "sudoku_solver_tim.cli", "--workers", workers],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        for grid in GRIDS[:2]:
+            process.stdin.write(grid + "\n")
+            process.stdin.flush()
+            assert json.loads(process.stdout.readline())["puzzle"] == grid
+    finally:
+        process.stdin.close()
+        process.wait(timeout=30)
+        process.stdout.close()
+    assert process.returncode == 0
+
+
+def test_start_does_not_load_the_cache():
+    code = "import sys, sudoku_solver_tim.cli; print('sqlite3' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout.strip() == "False"
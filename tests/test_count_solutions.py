@@ -0,0 +1,90 @@
+import pytest
+
+from sudoku_solver_tim.bitmask import POPCOUNT
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies.master.brute_force import count_solutions, puzzle_masks, split
+
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+# The last row of STRING with two givens less, which leaves more than one solution
+AMBIGUOUS = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6...."
+# Valid givens, but the 8 of the first row has no place left
+NO_SOLUTION = "1234567.." + "." * 18 + ".......8." + "." * 18 + "........8" + "." * 18
+
+
+@pytest.mark.parametrize("search", ["backtrack", "dlx"])
+def test_count_solutions(search):
+    assert Puzzle.from_string(STRING).count_solutions(search=search) == 1
+    assert Puzzle.from_string(AMBIGUOUS).count_solutions(search=search) == 2
+    assert Puzzle.from_string(NO_SOLUTION).count_solutions(search=search) == 0
+
+
+def test_count_solutions_limit():
+    p = Puzzle.from_string(AMBIGUOUS)
+    total = p.count_solutions(limit=None)
+    assert total > 2
+    assert p.count_solutions(limit=total + 10) == total
+    assert p.count_solutions(limit=1) == 1
+
+
+def test_count_solutions_does_not_change_the_puzzle():
+    p = Puzzle.from_string(STRING)
+    masks = [cell.mask for cell in p.cells]
+    assert p.count_solutions() == 1
+    assert [cell.mask for cell in p.cells] == masks
+    assert p.unsolved == STRING.count(".")
+    assert not p.strategies_used
+
+
+def test_has_unique_solution():
+    assert Puzzle.from_string(STRING).has_unique_solution()
+    assert not Puzzle.from_string(AMBIGUOUS).has_unique_solution()
+    assert not Puzzle.from_string(NO_SOLUTION).has_unique_solution()
+
+
+def test_invalid_search():
+    with pytest.raises(ValueError):
+        Puzzle.from_string(STRING).count_solutions(search="magic")
+
+
+def test_iter_solutions():
+    p = Puzzle.from_string(AMBIGUOUS)
+    grids = list(p.iter_solutions())
+    assert len(grids) == p.count_solutions(limit=None)
+    assert len({str(grid) for grid in grids}) == len(grids)
+    for grid in grids:
+        solved = Puzzle(grid)
+        assert solved.is_solved()
+        solved.validate()
+    assert p.unsolved == AMBIGUOUS.count(".")
+
+    assert list(Puzzle.from_string(NO_SOLUTION).iter_solutions()) == []
+
+
+def test_iter_solutions_is_lazy():
+    # An empty grid has billions of solutions
+    solutions = Puzzle.from_string("." * 81).iter_solutions()
+    first, second = next(solutions), next(solutions)
+    assert first != second
+
+
+@pytest.mark.parametrize("search", ["backtrack", "dlx"])
+def test_count_solutions_parallel(search):
+    # Fewer givens, for a search tree that is worth splitting
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..8...87.....16........."
+    p = Puzzle.from_string(string)
+    total = p.count_solutions(limit=None, search=search)
+    assert p.count_solutions(limit=None, search=search, parallel=2) == total
+    assert p.count_solutions(limit=3, search=search, parallel=2) == min(3, total)
+    assert Puzzle.from_string(NO_SOLUTION).count_solutions(parallel=2) == 0
+
+
+def test_split():
+    p = Puzzle.from_string(AMBIGUOUS)
+    subtrees = split(puzzle_masks(p), 4)
+    assert len(subtrees) >= 4 or all(_is_solved(masks) for masks in subtrees)
+    total = sum(count_solutions(masks) for masks in subtrees)
+    assert total == p.count_solutions(limit=None)
+
+
+def _is_solved(masks):
+    return all(POPCOUNT[mask] == 1 for mask in masks)
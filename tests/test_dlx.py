@@ -0,0 +1,43 @@
+import pytest
+
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies.master import dlx
+from sudoku_solver_tim.strategies.master.brute_force import brute_force, puzzle_masks, solutions
+
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+
+
+def test_matrix():
+    assert len(dlx.ROW_COLUMNS) == 729
+    assert len(dlx.COLUMN_ROWS) == 324
+    assert all(len(rows) == 9 for rows in dlx.COLUMN_ROWS)
+
+
+def test_solve_with_dlx():
+    p = Puzzle.from_string(STRING)
+    assert p.solve(strategies=[brute_force], search="dlx")
+    assert p.strategies_used == {"Brute Force"}
+
+    expected = Puzzle.from_string(STRING)
+    expected.solve(strategies=[brute_force])
+    assert p.grid == expected.grid
+
+
+def test_invalid_search():
+    with pytest.raises(ValueError):
+        Puzzle.from_string(STRING).solve(search="magic")
+
+
+def test_count_like_backtracking():
+    # Remove some givens so that there are multiple solutions
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6...."
+    masks = puzzle_masks(Puzzle.from_string(string))
+    found = list(dlx.solutions(list(masks)))
+    assert len(found) > 1
+    assert sorted(found) == sorted(solutions(list(masks)))
+
+
+def test_contradiction():
+    # r1c8 and r1c9 can both only be a 9
+    string = "1234567.." + "." * 18 + ".......8." + "." * 18 + "........8" + "." * 18
+    assert list(dlx.solutions(puzzle_masks(Puzzle.from_string(string)))) == []
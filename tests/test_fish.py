@@ -0,0 +1,34 @@
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies import STRATEGIES, brute_force, finned_fish, jellyfish
+from sudoku_solver_tim.bitmask import BIT
+
+
+# Needs a finned fish when solving without brute force
+FINNED = ".9.......78.3.2.....2..64......9....8....47.9..123..........9..6..7..2.4.345....1"
+
+
+def test_finned_fish():
+    without_finned = Puzzle.from_string(FINNED)
+    assert not without_finned.solve(strategies=[s for s in STRATEGIES if s not in (finned_fish, brute_force)])
+
+    p = Puzzle.from_string(FINNED)
+    assert p.solve(strategies=[s for s in STRATEGIES if s is not brute_force])
+    assert "Finned Fish" in p.strategies_used
+
+
+def test_fish_eliminations_keep_the_solution():
+    solution = Puzzle.from_string(FINNED)
+    brute_force(solution)
+
+    p = Puzzle.from_string(FINNED)
+    strategies = [s for s in STRATEGIES if s is not brute_force]
+    while not p.is_solved():
+        for strategy in strategies:
+            if strategy(p):
+                break
+        else:
+            break
+        # Also try the largest fish at every step
+        jellyfish(p)
+        for cell, solved in zip(p.cells, solution.cells):
+            assert cell.value == solved.value or cell.mask & BIT[solved.value]
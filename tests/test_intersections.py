@@ -0,0 +1,53 @@
+import pytest
+
+from sudoku_solver_tim.bitmask import BIT
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies import brute_force
+from sudoku_solver_tim.strategies.medium.intersections import (
+    INTERSECTION_MASKS,
+    pointing,
+)
+import sudoku_solver_tim.strategies.medium.candidate_lines as candidate_lines_module
+import sudoku_solver_tim.strategies.medium.double_pairs as double_pairs_module
+import sudoku_solver_tim.strategies.medium.multiple_lines as multiple_lines_module
+
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+
+
+def test_intersection_masks():
+    assert len(INTERSECTION_MASKS) == 54
+    assert all(mask.bit_count() == 3 for mask in INTERSECTION_MASKS)
+    # Every cell is in one row intersection and one column intersection
+    assert sum(INTERSECTION_MASKS) == 2 * ((1 << 81) - 1)
+
+
+def test_pointing_keeps_the_solution():
+    solution = Puzzle.from_string(STRING)
+    brute_force(solution)
+
+    p = Puzzle.from_string(STRING)
+    assert sum(pointing(p, block, digit) for block in range(9) for digit in range(1, 10)) > 0
+    for cell, solved in zip(p.cells, solution.cells):
+        assert cell.value == solved.value or cell.mask & BIT[solved.value]
+
+
+@pytest.mark.parametrize(
+    "module, name, helper",
+    [
+        (candidate_lines_module, "candidate_lines", "pointing"),
+        (double_pairs_module, "double_pairs", "band_line_pairs"),
+        (multiple_lines_module, "multiple_lines", "band_line_pairs"),
+    ],
+)
+def test_no_dirty_digits_is_no_work(monkeypatch, module, name, helper):
+    calls = []
+    monkeypatch.setattr(module, helper, lambda *args, **kwargs: calls.append(args) or 0)
+
+    p = Puzzle.from_string(STRING)
+    strategy = getattr(module, name)
+    assert strategy(p, []) is False
+    assert calls == []
+
+    # An explicit digit is still scanned
+    strategy(p, [1])
+    assert calls
@@ -0,0 +1,104 @@
+import gc
+import tracemalloc
+import weakref
+
+import pytest
+
+from sudoku_solver_tim.puzzle import Puzzle
+
+PUZZLE = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+SOLUTION = "254893167698715324713642589547381692926457831381926745169278453872534916435169278"
+# Three cells short of the solution, so a solve is cheap
+NEARLY_SOLVED = "." + SOLUTION[1:40] + "." + SOLUTION[41:80] + "."
+
+# More than the 128 entries of a global lru_cache, which used to keep puzzles alive.
+# Tracing allocations is slow, so this is kept well below a real batch run.
+N_SEQUENTIAL_SOLVES = 500
+
+
+def _solve(string):
+    p = Puzzle.from_string(string)
+    p.solve()
+    # Touch the derived group properties, which used to be cached globally
+    for block in p.blocks:
+        block.other_blocks_in_row, block.other_blocks_in_column
+    for row in p.rows:
+        row.blockrows, row.blocks
+    return p
+
+
+def test_solved_puzzle_is_released():
+    p = _solve(PUZZLE)
+    assert "".join(str(c.value) for c in p.cells) == SOLUTION
+    ref = weakref.ref(p)
+    del p
+    gc.collect()
+    assert ref() is None
+
+
+def test_puzzle_is_freed_without_cyclic_gc():
+    gc.disable()
+    try:
+        p = _solve(PUZZLE)
+        ref = weakref.ref(p)
+        del p
+        # Freed by reference counting alone: there are no reference cycles,
+        # also not once the groups have been built
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_cells_and_groups_of_a_freed_puzzle():
+    p = Puzzle.from_string(PUZZLE)
+    row = p.rows[0]
+    cell = p.cells[1]
+    assert cell.row is row
+    del p
+
+    # The group still holds its cells, but anything that needs the puzzle raises a clear error
+    assert cell in row.cells
+    with pytest.raises(ReferenceError, match="Row\\(id=0\\)"):
+        row.unsolved_values
+    with pytest.raises(ReferenceError, match="was freed"):
+        row.blocks
+    with pytest.raises(ReferenceError, match="row 1, column 2"):
+        cell.peers
+    with pytest.raises(ReferenceError):
+        cell.remove_markup(5)
+    with pytest.raises(ReferenceError):
+        cell.set_solution(5)
+
+
+def test_memory_stays_flat_across_sequential_solves():
+    tracemalloc.start()
+    try:
+        for _ in range(10):
+            _solve(NEARLY_SOLVED)
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(N_SEQUENTIAL_SOLVES):
+            _solve(NEARLY_SOLVED)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # A single puzzle is tens of kB, so retaining puzzles would show up immediately
+    assert current - baseline < 20_000
+
+
+def test_memory_budget():
+    # See the memory budget in the Puzzle docstring
+    n = 100
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        puzzles = [Puzzle.from_string(PUZZLE) for _ in range(n)]
+        bare, _ = tracemalloc.get_traced_memory()
+        for p in puzzles:
+            p.rows, p.columns, p.blocks, p.blockrows, p.blockcolumns
+        with_groups, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert (bare - baseline) / n < 24_000
+    assert (with_groups - baseline) / n < 40_000
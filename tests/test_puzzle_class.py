@@ -1,4 +1,8 @@
-from sudoku_solver_tim.puzzle import Puzzle
+import pytest
+
+from sudoku_solver_tim.puzzle import Cell, Puzzle, Row
+from sudoku_solver_tim.bitmask import BIT, DIGITS, POPCOUNT, ROW_MASKS
+from sudoku_solver_tim.topology import UNITS
 
 
 def test_puzzle_class():
@@ -44,3 +48,127 @@ def test_puzzle_from_string():
     ]
     puzzle = Puzzle.from_string(string)
     assert puzzle.grid == grid
+
+
+def test_cell_markup_mask():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    puzzle = Puzzle.from_string(string)
+    cell = puzzle.rows[0].cells[1]
+
+    # The markup view reflects the candidate mask
+    assert set(cell.markup) == set(DIGITS[cell.mask])
+    assert len(cell.markup) == POPCOUNT[cell.mask]
+    assert 2 not in cell.markup and 4 not in cell.markup and 8 not in cell.markup
+
+    # Removing by digit and by mask is equivalent
+    assert cell.remove_markup(5)
+    assert not cell.remove_markup(mask=BIT[5])
+    assert 5 not in cell.markup
+
+    # Updates through the view are written back to the mask
+    cell.markup.discard(6)
+    assert not cell.mask & BIT[6]
+    cell.markup = {1, 3}
+    assert cell.mask == BIT[1] | BIT[3]
+    assert cell.markup == {1, 3}
+    assert repr(cell.markup) == "{1, 3}"
+
+
+def test_bitboards():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    puzzle = Puzzle.from_string(string)
+
+    def assert_in_sync():
+        for digit in range(1, 10):
+            expected = sum(1 << c.index for c in puzzle.cells if c.mask & BIT[digit])
+            assert puzzle.bitboards[digit] == expected
+
+    assert_in_sync()
+    assert puzzle.candidate_cells(1, ROW_MASKS[0]) == [
+        c for c in puzzle.rows[0].cells if 1 in c.markup
+    ]
+
+    puzzle.solve_step()
+    assert_in_sync()
+    puzzle.solve()
+    assert_in_sync()
+    assert puzzle.bitboards == [0] * 10
+
+
+def test_unit_positions():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    puzzle = Puzzle.from_string(string)
+
+    def assert_in_sync():
+        for unit, cells in enumerate(UNITS):
+            for digit in range(1, 10):
+                expected = sum(1 << k for k, i in enumerate(cells) if puzzle.cells[i].mask & BIT[digit])
+                assert puzzle.unit_positions[unit][digit] == expected
+
+    assert_in_sync()
+    assert puzzle.rows[0].unsolved_values == {1, 3, 5, 6, 7, 9}
+    assert Row(0, [Cell(0, 0, c) for c in range(9)]).unsolved_values == set(range(1, 10))
+
+    puzzle.solve_step()
+    assert_in_sync()
+    puzzle.solve()
+    assert_in_sync()
+
+
+def test_unsolved_counter_and_validate():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    puzzle = Puzzle.from_string(string)
+    assert puzzle.unsolved == string.count(".")
+    assert not puzzle.is_solved()
+
+    puzzle.solve_step()
+    assert puzzle.unsolved == sum(1 for c in puzzle.cells if c.value == 0)
+
+    assert puzzle.solve()
+    assert puzzle.unsolved == 0
+    assert puzzle.is_solved()
+    puzzle.validate()
+
+    # Swapping two values in a row keeps the row valid, but breaks their columns
+    a, b = puzzle.cells[0], puzzle.cells[1]
+    a.value, b.value = b.value, a.value
+    with pytest.raises(Exception, match="Invalid puzzle solution"):
+        puzzle.validate()
+
+
+def test_change_journal():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    puzzle = Puzzle.from_string(string)
+
+    # Everything is dirty for a scan that never ran before, and nothing right after it
+    assert puzzle.dirty_units("units") == list(range(27))
+    assert puzzle.dirty_digits("digits") == list(range(1, 10))
+    assert puzzle.dirty_units("units") == []
+    assert puzzle.dirty_digits("digits") == []
+
+    # Removing a candidate marks the row, column and block of the cell and the digit
+    cell = puzzle.cells[1]  # r1c2, block 0
+    assert cell.remove_markup(5)
+    assert puzzle.dirty_units("units") == [0, 9 + 1, 18 + 0]
+    assert puzzle.dirty_digits("digits") == [5]
+
+    # Scans are tracked per key
+    assert puzzle.dirty_digits("other") == list(range(1, 10))
+
+
+def test_unchanged_markup_is_not_a_change():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    puzzle = Puzzle.from_string(string)
+    puzzle.dirty_units("units"), puzzle.dirty_digits("digits")
+    clock, events, naked_singles = puzzle.clock, dict(puzzle.events), list(puzzle.naked_singles)
+
+    cell = puzzle.cells[1]  # r1c2, 2 is given in its row
+    cell.markup = set(cell.markup)
+    cell.markup.add(next(iter(cell.markup)))
+    cell.markup.discard(2)
+
+    assert puzzle.clock == clock
+    assert puzzle.events == events
+    assert puzzle.naked_singles == naked_singles
+    assert puzzle.dirty_units("units") == []
+    assert puzzle.dirty_digits("digits") == []
@@ -0,0 +1,45 @@
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies.easy.single_candidates import single_candidates
+
+
+def test_single_candidates():
+    """
+    Very easy puzzle that can be solved with single candidates only.
+    """
+    grid = [
+        [2, 5, 0, 0, 3, 0, 9, 0, 1],
+        [0, 1, 0, 0, 0, 4, 0, 0, 0],
+        [4, 0, 7, 0, 0, 0, 2, 0, 8],
+        [0, 0, 5, 2, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 9, 8, 1, 0, 0],
+        [0, 4, 0, 0, 0, 3, 0, 0, 0],
+        [0, 0, 0, 3, 6, 0, 0, 7, 2],
+        [0, 7, 0, 0, 0, 0, 0, 0, 3],
+        [9, 0, 3, 0, 0, 0, 6, 0, 4],
+    ]
+    p = Puzzle(grid)
+
+    # The worklist holds exactly the cells with a single candidate
+    assert sorted(set(p.naked_singles)) == [
+        c.index for c in p.cells if not c.is_solved and len(c.markup) == 1
+    ]
+
+    assert single_candidates(p)
+    assert p.is_solved()
+    assert p.naked_singles == []
+    assert p.strategies_used == {"Single Candidate"}
+
+    # Nothing left to do
+    assert not single_candidates(p)
+
+
+def test_remove_markup_enqueues_naked_single():
+    p = Puzzle.from_string("." * 81)
+    cell = p.cells[40]
+    assert p.naked_singles == []
+    cell.remove_markup({1, 2, 3, 4, 5, 6, 7, 8})
+    assert p.naked_singles == [40]
+
+    assert single_candidates(p)
+    assert cell.value == 9
+    assert all(9 not in peer.markup for peer in cell.peers)
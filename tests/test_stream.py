@@ -0,0 +1,138 @@
+import csv
+import gzip
+import io
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from sudoku_solver_tim.stream import iter_solve, read_puzzles, write_csv, write_ndjson
+
+GRIDS_PATH = Path(__file__).parent / "fixtures" / "grids.txt"
+GRIDS = GRIDS_PATH.read_text().split()[:30]
+STRING = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+
+
+def test_read_puzzles(tmp_path):
+    text = "# puzzles\n" + "\n".join(GRIDS[:3]) + "\n\n"
+    assert list(read_puzzles(io.StringIO(text))) == GRIDS[:3]
+    assert list(read_puzzles(io.BytesIO(text.encode()))) == GRIDS[:3]
+    assert list(read_puzzles(io.BytesIO(gzip.compress(text.encode())))) == GRIDS[:3]
+
+    path = tmp_path / "puzzles.txt.gz"
+    path.write_bytes(gzip.compress(text.encode()))
+    assert list(read_puzzles(path)) == GRIDS[:3]
+    assert list(read_puzzles(str(path))) == GRIDS[:3]
+
+
+def test_read_puzzles_is_lazy():
+    puzzles = read_puzzles(GRIDS_PATH)
+    assert next(puzzles) == GRIDS[0]
+    puzzles.close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_solve(workers):
+    results = list(iter_solve(GRIDS, workers=workers, chunksize=4, read_ahead=8))
+    assert [r.index for r in results] == list(range(len(GRIDS)))
+    assert [r.puzzle for r in results] == GRIDS
+    assert all(r.solved and "." not in r.solution for r in results)
+
+
+def test_iter_solve_read_ahead():
+    read = []
+
+    def puzzles():
+        for string in GRIDS:
+            read.append(string)
+            yield string
+
+    results = iter_solve(puzzles(), workers=2, chunksize=2, read_ahead=6)
+    next(results)
+    # Reading stops once the buffer of pending chunks is full
+    assert len(read) <= 6 + 2
+    results.close()
+
+
+def test_iter_solve_slow_source():
+    # The producer blocks after its first puzzle, like a pipe that is still open
+    release = threading.Event()
+    read = []
+
+    def puzzles():
+        for string in GRIDS[:3]:
+            read.append(string)
+            yield string
+            release.wait(timeout=30)
+
+    results = iter_solve(puzzles(), workers=2)
+    try:
+        assert next(results).puzzle == GRIDS[0]
+        assert len(read) == 1
+    finally:
+        release.set()
+    assert [r.puzzle for r in results] == GRIDS[1:3]
+
+
+def test_iter_solve_source_error():
+    def puzzles():
+        yield from GRIDS[:3]
+        raise OSError("read failed")
+
+    results = iter_solve(puzzles(), workers=2, chunksize=2, read_ahead=4)
+    with pytest.raises(OSError, match="read failed"):
+        list(results)
+
+
+def test_iter_solve_read_ahead_below_chunksize():
+    with pytest.raises(ValueError, match="read_ahead"):
+        iter_solve(GRIDS, workers=2, chunksize=64, read_ahead=32)
+    with pytest.raises(ValueError, match="chunksize"):
+        iter_solve(GRIDS, chunksize=0)
+    # A single worker doesn't read ahead
+    assert len(list(iter_solve(GRIDS[:2], workers=1, chunksize=64, read_ahead=32))) == 2
+
+
+def test_iter_solve_invalid_line():
+    results = list(iter_solve(io.StringIO(STRING + "\n123\n")))
+    assert results[0].solved
+    assert not results[1].solved
+    assert "81 cells" in results[1].error
+
+
+def test_write_ndjson():
+    f = io.StringIO()
+    assert write_ndjson(iter_solve(io.StringIO(STRING)), f) == 1
+    record = json.loads(f.getvalue())
+    assert record["index"] == 0
+    assert record["puzzle"] == STRING
+    assert record["solved"] is True
+    assert "Brute Force" in record["strategies_used"]
+    assert record["error"] is None
+
+
+def test_write_csv():
+    f = io.StringIO()
+    assert write_csv(iter_solve(GRIDS[:3]), f) == 3
+    rows = list(csv.DictReader(io.StringIO(f.getvalue())))
+    assert [row["puzzle"] for row in rows] == GRIDS[:3]
+    assert rows[0]["solved"] == "True"
+
+
+def test_read_puzzles_keeps_file_open():
+    f = io.BytesIO(gzip.compress(STRING.encode()))
+    assert list(read_puzzles(f)) == [STRING]
+    assert not f.closed
+
+
+def test_iter_solve_non_ascii_bytes():
+    data = b"\xef\xbb\xbf" + STRING.encode() + b"\n2\xe9" + STRING[2:].encode() + b"\n" + STRING.encode() + b"\n"
+    assert list(read_puzzles(io.BytesIO(data)))[::2] == [STRING, STRING]
+
+    results = list(iter_solve(io.BytesIO(data)))
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].solved and results[2].solved
+    assert not results[1].solved
+    assert results[1].error
+    assert results[1].puzzle == "2?" + STRING[2:]
@@ -0,0 +1,38 @@
+from sudoku_solver_tim.bitmask import to_mask
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies.advanced.subsets import find_hidden_subsets, locked_sets
+from sudoku_solver_tim.topology import UNITS
+
+
+def test_locked_sets():
+    masks = [
+        to_mask({1, 2}),
+        to_mask({2, 3}),
+        to_mask({1, 3}),
+        to_mask({1, 2, 3, 4, 5}),  # too many candidates to be part of any subset
+        0,  # solved cell
+        to_mask({4, 5}),
+    ]
+    assert locked_sets(masks, 2) == []
+    assert locked_sets(masks, 3) == [((0, 1, 2), to_mask({1, 2, 3}))]
+    assert locked_sets(masks, 4) == []
+
+    # A cell with fewer candidates can be part of a larger subset
+    masks = [to_mask({1, 2}), to_mask({1, 2, 3}), to_mask({3}), to_mask({1, 2, 3, 4})]
+    assert locked_sets(masks, 3) == [((0, 1, 2), to_mask({1, 2, 3}))]
+
+
+def test_hidden_subsets_use_puzzle_positions():
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    with_positions = Puzzle.from_string(string)
+    without_positions = Puzzle.from_string(string)
+
+    for unit, cells in enumerate(UNITS):
+        for size in (2, 3, 4):
+            updated = find_hidden_subsets(
+                [with_positions.cells[i] for i in cells], size, with_positions.unit_positions[unit]
+            )
+            expected = find_hidden_subsets([without_positions.cells[i] for i in cells], size)
+            assert [c.index for c in updated] == [c.index for c in expected]
+
+    assert [c.mask for c in with_positions.cells] == [c.mask for c in without_positions.cells]
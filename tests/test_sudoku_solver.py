@@ -1,4 +1,5 @@
 from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.strategies import STRATEGIES
 
 
 def test_solving_sudokus():
@@ -144,3 +145,21 @@ def test_solving_sudokus():
 #     [0, 0, 0, 0, 0, 0, 0, 0, 0],
 #     [0, 0, 0, 0, 0, 0, 0, 0, 0]
 # ]
+
+
+def test_scheduler_skips_strategies_without_new_events():
+    # Needs strategies beyond the singles, so the expensive ones are tried more than once
+    string = "2.48........7.5....13.....9..7.......26....3.3...26.4...9..845.87.....16....6.2.."
+    p = Puzzle.from_string(string)
+    assert p.solve()
+    assert p.skipped_invocations > 0
+    assert p.events["solved"] == string.count(".")
+
+    # Skipping does not change which strategies are needed
+    naive = Puzzle.from_string(string)
+    while not naive.is_solved():
+        for strategy in STRATEGIES:
+            if strategy(naive):
+                break
+    assert naive.strategies_used == p.strategies_used
+    assert naive.grid == p.grid
@@ -0,0 +1,39 @@
+from sudoku_solver_tim.puzzle import Puzzle
+from sudoku_solver_tim.topology import (
+    BLOCKS,
+    CELL_UNITS,
+    INTERSECTIONS,
+    PEERS,
+    UNITS,
+)
+
+
+def test_topology_tables():
+    assert len(UNITS) == 27
+    assert all(len(unit) == 9 for unit in UNITS)
+    assert all(len(peers) == 20 for peers in PEERS)
+
+    # Peers are symmetric and share a unit
+    for i, peers in enumerate(PEERS):
+        for j in peers:
+            assert i in PEERS[j]
+            assert set(CELL_UNITS[i]) & set(CELL_UNITS[j])
+
+    # Every block crosses 3 rows and 3 columns in 3 cells each
+    assert len(INTERSECTIONS) == 54
+    for block, line, cells in INTERSECTIONS:
+        assert len(cells) == 3
+        assert set(cells) <= set(BLOCKS[block]) & set(UNITS[line])
+
+
+def test_puzzle_groups_match_topology():
+    p = Puzzle.from_string("." * 81)
+    for unit, group in zip(UNITS, p.rows + p.columns + p.blocks):
+        assert [c.index for c in group.cells] == list(unit)
+    for cell in p.cells:
+        assert cell in cell.row.cells
+        assert cell in cell.column.cells
+        assert cell in cell.block.cells
+        assert cell in cell.blockrow.cells
+        assert cell in cell.blockcolumn.cells
+        assert {c.index for c in cell.peers} == set(PEERS[cell.index])